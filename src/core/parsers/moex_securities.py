@@ -5,14 +5,118 @@
 и исторических данных о котировках.
 """
 
+import asyncio
+import importlib.util
+import math
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import Any
 from matplotlib import dates as mdates
+from matplotlib.backends import BackendFilter, backend_registry
 import httpx
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import traceback
+from pandas.api.types import union_categoricals
+import time
+import logging
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+logger = logging.getLogger(__name__)
+
+
+def _accept_encoding() -> str:
+    """
+    Формирует заголовок Accept-Encoding из кодеков, доступных httpx.
+
+    Returns:
+        Значение заголовка, например "zstd, br, gzip"
+    """
+    # Модули только проверяются на наличие: декодирование выполняет httpx
+    encodings = []
+    if importlib.util.find_spec("zstandard") is not None:
+        encodings.append("zstd")
+    if importlib.util.find_spec("brotli") is not None:
+        encodings.append("br")
+    encodings.append("gzip")
+    return ", ".join(encodings)
+
+
+# Бэкенды matplotlib без окон, допускающие отрисовку вне главного потока
+_NON_INTERACTIVE_BACKENDS = frozenset(
+    backend_registry.list_builtin(BackendFilter.NON_INTERACTIVE)
+)
+
+# Пустой датафрейм свечей с итоговой схемой (возвращается копия)
+_EMPTY_CANDLES = pd.DataFrame(
+    {
+        "open": pd.Series(dtype="float64"),
+        "close": pd.Series(dtype="float64"),
+        "high": pd.Series(dtype="float64"),
+        "low": pd.Series(dtype="float64"),
+        "value": pd.Series(dtype="float64"),
+        "volume": pd.Series(dtype="float64"),
+        "begin": pd.Series(dtype="datetime64[ns]"),
+        "end": pd.Series(dtype="datetime64[ns]"),
+        "secid": pd.Series(dtype="category"),
+        "shortname": pd.Series(dtype="category"),
+    }
+)
+
+
+def _is_nan(value: Any) -> bool:
+    """Быстрая проверка на NaN для скалярных значений из строк DataFrame."""
+    return isinstance(value, float) and math.isnan(value)
+
+
+def _rows_to_columnar(rows: list[list[Any]], cols: list[str]) -> pd.DataFrame:
+    """
+    Строит DataFrame из построчного ответа ISS API, передавая данные по столбцам.
+
+    Args:
+        rows: Список строк из блока "data" ответа MOEX
+        cols: Названия столбцов из блока "columns" ответа MOEX
+
+    Returns:
+        DataFrame с данными ответа
+    """
+    if not rows:
+        return pd.DataFrame(columns=cols)
+    return pd.DataFrame(dict(zip(cols, map(list, zip(*rows)))))
+
+
+def _concat_columnar(
+    chunks: list[dict[str, Any]], sort_by: str | None = None
+) -> pd.DataFrame:
+    """
+    Объединяет наборы столбцов с одинаковой схемой в один DataFrame.
+
+    Столбцы склеиваются через np.concatenate (категории - через
+    union_categoricals), итоговый DataFrame строится один раз. Сортировка
+    (если нужна) применяется к массивам до построения DataFrame.
+
+    Args:
+        chunks: Словари {столбец: массив} с одинаковыми столбцами и типами
+        sort_by: Столбец для устойчивой сортировки результата
+
+    Returns:
+        Объединенный DataFrame с индексом 0..N-1
+    """
+    columns: dict[str, Any] = {}
+    for col, first in chunks[0].items():
+        if isinstance(first, pd.Categorical):
+            # Категории объединяются без распаковки в строки
+            columns[col] = union_categoricals([chunk[col] for chunk in chunks])
+        else:
+            columns[col] = np.concatenate([chunk[col] for chunk in chunks])
+    if sort_by is not None:
+        order = np.argsort(columns[sort_by], kind="stable")
+        columns = {col: values[order] for col, values in columns.items()}
+    return pd.DataFrame(columns)
 
 
 class MoexSecuritiesParser:
@@ -31,6 +135,11 @@ class MoexSecuritiesParser:
         "5": {"search": "TCS Bank", "display": "Т-Банк"},
     }
 
+    # Пункты меню выбора банка: (ключ, поисковый запрос, отображаемое название)
+    _BANK_ITEMS = tuple(
+        (key, value["search"], value["display"]) for key, value in BANK_NAMES.items()
+    )
+
     # Маппинг типов ценных бумаг (ключ - русское название, значение - тип в API MOEX)
     # Используются реальные типы из MOEX API
     SECURITY_TYPES = {
@@ -48,6 +157,77 @@ class MoexSecuritiesParser:
         "exchange_bond": "биржевая облигация",
     }
 
+    # Номер пункта меню -> интервал свечей ISS API
+    INTERVAL_CHOICES = MappingProxyType(
+        {
+            "1": 1,  # 1 минута
+            "2": 10,  # 10 минут
+            "3": 60,  # 1 час
+            "4": 24,  # 1 день
+            "5": 7,  # 1 неделя
+            "6": 31,  # 1 месяц
+            "7": 4,  # 1 квартал
+            "8": 12,  # 1 год
+        }
+    )
+
+    # Названия интервалов свечей для вывода
+    INTERVAL_NAMES = MappingProxyType(
+        {
+            1: "1 минута",
+            10: "10 минут",
+            60: "1 час",
+            24: "1 день",
+            7: "1 неделя",
+            31: "1 месяц",
+            4: "1 квартал",
+            12: "1 год",
+        }
+    )
+
+    # Столбцы, запрашиваемые у ISS API (остальные данные не используются)
+    CANDLES_COLUMNS = (
+        "open",
+        "close",
+        "high",
+        "low",
+        "value",
+        "volume",
+        "begin",
+        "end",
+    )
+    SECURITIES_COLUMNS = (
+        "secid",
+        "shortname",
+        "name",
+        "isin",
+        "type",
+        "primary_boardid",
+    )
+
+    # Формат дат в ответах ISS API ("2024-05-01 00:00:00")
+    ISS_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+    # Столбцы, выводимые при диагностике тикера без данных
+    DIAGNOSTIC_COLUMNS = [
+        "secid",
+        "primary_boardid",
+        "board",
+        "type",
+        "shortname",
+        "name",
+        "isin",
+    ]
+
+    # Время жизни кэша ответов ISS API в секундах
+    CACHE_TTL = 300.0
+
+    # Максимальное число записей в каждом кэше
+    CACHE_MAX_ENTRIES = 512
+
+    # Максимальное число одновременных запросов к ISS API
+    MAX_CONCURRENT_REQUESTS = 5
+
     def __init__(self, timeout: float = 30.0):
         """
         Инициализация парсера MOEX.
@@ -58,6 +238,15 @@ class MoexSecuritiesParser:
         self.timeout = timeout
         self.client: httpx.AsyncClient | None = None
         self.base_url = "https://iss.moex.com/iss"
+        # Кэш ответов: ключ запроса -> (время получения, DataFrame)
+        self._securities_cache: dict[str, tuple[float, pd.DataFrame]] = {}
+        self._candles_cache: dict[
+            tuple[str, str, str, str, int], tuple[float, pd.DataFrame]
+        ] = {}
+        # Выполняющиеся запросы свечей: одинаковые запросы ждут один ответ
+        self._candles_pending: dict[
+            tuple[str, str, str, str, int], asyncio.Task[pd.DataFrame]
+        ] = {}
 
     async def __aenter__(self):
         """Вход в контекстный менеджер."""
@@ -74,6 +263,7 @@ class MoexSecuritiesParser:
             self.client = httpx.AsyncClient(
                 timeout=self.timeout,
                 follow_redirects=True,
+                headers={"Accept-Encoding": _accept_encoding()},
             )
 
     async def close(self) -> None:
@@ -82,6 +272,40 @@ class MoexSecuritiesParser:
             await self.client.aclose()
             self.client = None
 
+    def _get_cached(self, cache: dict, key: Any) -> pd.DataFrame | None:
+        """
+        Возвращает закэшированный DataFrame, если срок его жизни не истек.
+
+        Args:
+            cache: Словарь кэша
+            key: Ключ запроса
+
+        Returns:
+            DataFrame из кэша или None
+        """
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        stored_at, df = entry
+        if time.monotonic() - stored_at > self.CACHE_TTL:
+            del cache[key]
+            return None
+        return df
+
+    def _store_cached(self, cache: dict, key: Any, df: pd.DataFrame) -> None:
+        """
+        Сохраняет DataFrame в кэш, вытесняя самые старые записи при переполнении.
+
+        Args:
+            cache: Словарь кэша
+            key: Ключ запроса
+            df: Сохраняемый DataFrame
+        """
+        cache.pop(key, None)
+        cache[key] = (time.monotonic(), df)
+        while len(cache) > self.CACHE_MAX_ENTRIES:
+            del cache[next(iter(cache))]
+
     async def get_securities_info(self, search_query: str) -> pd.DataFrame:
         """
         Получение информации о ценных бумагах по поисковому запросу.
@@ -92,24 +316,38 @@ class MoexSecuritiesParser:
         Returns:
             DataFrame с информацией о найденных ценных бумагах
         """
+        cached = self._get_cached(self._securities_cache, search_query)
+        if cached is not None:
+            return cached
+
         if not self.client:
             await self.start()
 
         url = f"{self.base_url}/securities.json"
-        params = {"q": search_query}
+        params = {
+            "q": search_query,
+            "iss.only": "securities",
+            "securities.columns": ",".join(self.SECURITIES_COLUMNS),
+        }
 
         try:
             response = await self.client.get(url, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = _json_loads(response.content)
 
             cols = data["securities"]["columns"]
             securities_data = data["securities"]["data"]
 
-            df = pd.DataFrame(securities_data, columns=cols)
+            df = _rows_to_columnar(securities_data, cols)
+            # Тип бумаги повторяется у многих строк - категориальный столбец
+            # ускоряет фильтрацию по типу и unique()
+            if "type" in df.columns:
+                df["type"] = df["type"].astype("category")
+            if not df.empty:
+                self._store_cached(self._securities_cache, search_query, df)
             return df
         except Exception as e:
-            print(f"Ошибка при получении информации о ценных бумагах: {e}")
+            logger.warning("Ошибка при получении информации о ценных бумагах: %s", e)
             return pd.DataFrame()
 
     async def get_candles(
@@ -133,15 +371,57 @@ class MoexSecuritiesParser:
         Returns:
             DataFrame с историческими данными о котировках
         """
-        if not self.client:
-            await self.start()
-
         # Устанавливаем значения по умолчанию для дат
         if date_from is None:
             date_from = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
         if date_till is None:
             date_till = datetime.now().strftime("%Y-%m-%d")
 
+        cache_key = (secid, board, date_from, date_till, interval)
+        cached = self._get_cached(self._candles_cache, cache_key)
+        if cached is not None:
+            return cached
+
+        task = self._candles_pending.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(
+                self._fetch_candles(secid, board, date_from, date_till, interval)
+            )
+            self._candles_pending[cache_key] = task
+            task.add_done_callback(
+                lambda _: self._candles_pending.pop(cache_key, None)
+            )
+
+        # shield: отмена одного из ожидающих не прерывает общий запрос
+        df = await asyncio.shield(task)
+        if not df.empty:
+            self._store_cached(self._candles_cache, cache_key, df)
+        return df
+
+    async def _fetch_candles(
+        self,
+        secid: str,
+        board: str,
+        date_from: str,
+        date_till: str,
+        interval: int,
+    ) -> pd.DataFrame:
+        """
+        Запрос свечей у ISS API без использования кэша.
+
+        Args:
+            secid: Тикер ценной бумаги
+            board: Торговая площадка
+            date_from: Дата начала периода в формате "YYYY-MM-DD"
+            date_till: Дата окончания периода в формате "YYYY-MM-DD"
+            interval: Интервал свечей
+
+        Returns:
+            DataFrame с историческими данными о котировках
+        """
+        if not self.client:
+            await self.start()
+
         url = (
             f"{self.base_url}/engines/stock/"
             f"markets/shares/boards/{board}/securities/{secid}/candles.json"
@@ -151,84 +431,100 @@ class MoexSecuritiesParser:
             "from": date_from,
             "till": date_till,
             "interval": interval,
+            "iss.only": "candles",
+            "candles.columns": ",".join(self.CANDLES_COLUMNS),
         }
 
-        print("Запрос к MOEX API:")
-        print(f"   URL: {url}")
-        print(f"   Параметры: {params}")
+        logger.debug("Запрос к MOEX API: %s, параметры: %s", url, params)
 
         try:
             response = await self.client.get(url, params=params)
             response.raise_for_status()
-            data = response.json()
-
-            # Диагностика: проверяем структуру ответа
-            print("Структура ответа API:")
-            print(f"   Ключи верхнего уровня: {list(data.keys())}")
+            data = _json_loads(response.content)
 
             if "candles" not in data:
-                print("Ключ 'candles' не найден в ответе")
-                print(f"   Доступные ключи: {list(data.keys())}")
-                # Попробуем найти альтернативные ключи
-                for key in data.keys():
-                    if isinstance(data[key], dict) and "columns" in data[key]:
-                        print(f"   Найден альтернативный ключ: {key}")
-                        cols = data[key]["columns"]
-                        candles_data = data[key]["data"]
-                        df = pd.DataFrame(candles_data, columns=cols)
-                        print(f"Получено {len(df)} записей через ключ '{key}'")
-                        return df
+                logger.debug("Ключ 'candles' не найден в ответе: %s", list(data))
                 return pd.DataFrame()
 
             cols = data["candles"]["columns"]
             candles_data = data["candles"]["data"]
 
-            print(f"   Колонки: {cols}")
-            print(f"   Количество записей: {len(candles_data)}")
+            logger.debug(
+                "Колонки: %s, количество записей: %d", cols, len(candles_data)
+            )
 
             if not candles_data:
-                print("Данные свечей пусты")
-                # Проверяем, есть ли информация об ошибке в ответе
-                if "error" in data:
-                    print(f"   Ошибка от API: {data['error']}")
                 # Пробуем другие торговые площадки
-                print("🔄 Пробуем другие торговые площадки...")
+                logger.debug("Данные свечей пусты, пробуем другие торговые площадки")
                 alternative_boards = ["TQTF", "EQBR", "EQEU", "SMAL"]
                 for alt_board in alternative_boards:
-                    print(f"   Пробуем площадку: {alt_board}")
+                    logger.debug("Пробуем площадку: %s", alt_board)
                     alt_url = url.replace(f"/{board}/", f"/{alt_board}/")
                     try:
                         alt_response = await self.client.get(alt_url, params=params)
                         alt_response.raise_for_status()
-                        alt_data = alt_response.json()
+                        alt_data = _json_loads(alt_response.content)
                         if "candles" in alt_data and alt_data["candles"]["data"]:
-                            print(f"   Найдены данные на площадке {alt_board}!")
+                            logger.debug("Найдены данные на площадке %s", alt_board)
                             cols = alt_data["candles"]["columns"]
                             candles_data = alt_data["candles"]["data"]
-                            df = pd.DataFrame(candles_data, columns=cols)
+                            df = _rows_to_columnar(candles_data, cols)
                             return df
                     except Exception as alt_e:
-                        print(f"   Ошибка на {alt_board}: {alt_e}")
+                        logger.debug("Ошибка на %s: %s", alt_board, alt_e)
                         continue
 
-            df = pd.DataFrame(candles_data, columns=cols)
-
-            if df.empty:
-                print("DataFrame создан, но пуст")
-            else:
-                print(f"Успешно создан DataFrame с {len(df)} строками")
-                print(f"   Колонки в DataFrame: {list(df.columns)}")
+            df = _rows_to_columnar(candles_data, cols)
+            logger.debug("Создан DataFrame с %d строками", len(df))
 
             return df
         except httpx.HTTPStatusError as e:
-            print(f"HTTP ошибка {e.response.status_code}: {e.response.text[:200]}")
+            logger.warning(
+                "HTTP ошибка %s: %s", e.response.status_code, e.response.text[:200]
+            )
             return pd.DataFrame()
-        except Exception as e:
-            print(f"Ошибка при получении данных о котировках: {e}")
-
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Ошибка при получении данных о котировках")
             return pd.DataFrame()
 
+    async def _probe_boards(
+        self,
+        secid: str,
+        boards: list[str],
+        date_from: str | None,
+        date_till: str | None,
+        interval: int,
+    ) -> pd.DataFrame:
+        """
+        Параллельно запрашивает свечи тикера на нескольких торговых площадках.
+
+        Args:
+            secid: Тикер ценной бумаги
+            boards: Площадки в порядке приоритета
+            date_from: Дата начала периода в формате "YYYY-MM-DD"
+            date_till: Дата окончания периода в формате "YYYY-MM-DD"
+            interval: Интервал свечей
+
+        Returns:
+            Первый непустой DataFrame в порядке boards или пустой DataFrame
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+
+        async def fetch(board: str) -> pd.DataFrame:
+            async with semaphore:
+                return await self.get_candles(
+                    secid, board, date_from, date_till, interval
+                )
+
+        results = await asyncio.gather(
+            *(fetch(board) for board in boards), return_exceptions=True
+        )
+        for board, result in zip(boards, results):
+            if isinstance(result, pd.DataFrame) and not result.empty:
+                logger.debug("Данные найдены на площадке %s", board)
+                return result
+        return pd.DataFrame()
+
     async def parse_securities(
         self,
         bank_choice: str,
@@ -236,6 +532,7 @@ class MoexSecuritiesParser:
         date_from: str | None = None,
         date_till: str | None = None,
         interval: int = 24,
+        prefetch_candles: bool = False,
     ) -> dict[str, Any]:
         """
         Полный цикл парсинга: получение информации о ценных бумагах и котировок.
@@ -246,6 +543,8 @@ class MoexSecuritiesParser:
             date_from: Дата начала периода в формате "YYYY-MM-DD"
             date_till: Дата окончания периода в формате "YYYY-MM-DD"
             interval: Интервал свечей
+            prefetch_candles: Загрузить свечи по всем найденным бумагам
+                (запросы выполняются параллельно, результат в "candles_by_secid")
 
         Returns:
             Словарь с данными о ценных бумагах и котировках
@@ -262,7 +561,7 @@ class MoexSecuritiesParser:
         bank_info = self.BANK_NAMES[bank_choice]
         search_query = bank_info["search"]
 
-        print(f"Поиск ценных бумаг для: {bank_info['display']}")
+        logger.debug("Поиск ценных бумаг для: %s", bank_info["display"])
 
         # Получаем информацию о ценных бумагах
         securities_df = await self.get_securities_info(search_query)
@@ -280,7 +579,7 @@ class MoexSecuritiesParser:
         if security_type:
             if security_type in self.SECURITY_TYPES:
                 type_value = self.SECURITY_TYPES[security_type]
-                securities_df = securities_df[securities_df["type"] == type_value]
+                securities_df = securities_df[securities_df["type"].eq(type_value)]
 
         result = {
             "bank_info": bank_info,
@@ -289,8 +588,60 @@ class MoexSecuritiesParser:
             "charts_generated": False,
         }
 
+        if prefetch_candles:
+            result["candles_by_secid"] = await self._prefetch_candles(
+                securities_df, date_from, date_till, interval
+            )
+
         return result
 
+    async def _prefetch_candles(
+        self,
+        securities_df: pd.DataFrame,
+        date_from: str | None,
+        date_till: str | None,
+        interval: int,
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Параллельно загружает свечи по всем ценным бумагам из датафрейма.
+
+        Args:
+            securities_df: Датафрейм с ценными бумагами (столбцы secid, primary_boardid)
+            date_from: Дата начала периода в формате "YYYY-MM-DD"
+            date_till: Дата окончания периода в формате "YYYY-MM-DD"
+            interval: Интервал свечей
+
+        Returns:
+            Словарь {тикер: DataFrame со свечами}
+        """
+        if securities_df.empty or "secid" not in securities_df.columns:
+            return {}
+
+        if "primary_boardid" in securities_df.columns:
+            boards = securities_df["primary_boardid"].fillna("TQBR").tolist()
+        else:
+            boards = ["TQBR"] * len(securities_df)
+        secids = securities_df["secid"].tolist()
+
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+
+        async def fetch(secid: str, board: str) -> pd.DataFrame:
+            async with semaphore:
+                return await self.get_candles(
+                    secid, board, date_from, date_till, interval
+                )
+
+        # Один запрос на тикер (первая встретившаяся площадка)
+        targets: dict[str, str] = {}
+        for secid, board in zip(secids, boards):
+            if secid and not pd.isna(secid):
+                targets.setdefault(str(secid), str(board))
+
+        frames = await asyncio.gather(
+            *(fetch(secid, board) for secid, board in targets.items())
+        )
+        return dict(zip(targets, frames))
+
     def _format_candles_dataframe(
         self,
         df: pd.DataFrame,
@@ -309,90 +660,83 @@ class MoexSecuritiesParser:
             Отформатированный датафрейм с столбцами: open, close, high, low, value, volume, begin, end, secid, shortname
         """
         if df.empty:
-            return pd.DataFrame(
-                columns=[
-                    "open",
-                    "close",
-                    "high",
-                    "low",
-                    "value",
-                    "volume",
-                    "begin",
-                    "end",
-                    "secid",
-                    "shortname",
-                ]
-            )
+            return _EMPTY_CANDLES.copy()
 
-        # Создаем копию датафрейма
-        formatted_df = df.copy()
-
-        # Проверяем наличие необходимых столбцов и переименовываем при необходимости
-        column_mapping = {
-            "OPEN": "open",
-            "CLOSE": "close",
-            "HIGH": "high",
-            "LOW": "low",
-            "VALUE": "value",
-            "VOLUME": "volume",
-            "BEGIN": "begin",
-            "END": "end",
-        }
+        columns = self._format_candles_columns(df, secid, shortname)
+        return pd.DataFrame(columns, index=pd.RangeIndex(len(df)))
 
-        # Переименовываем столбцы если они в верхнем регистре
-        for old_col, new_col in column_mapping.items():
-            if old_col in formatted_df.columns and new_col not in formatted_df.columns:
-                formatted_df = formatted_df.rename(columns={old_col: new_col})
-
-        # Выбираем только нужные столбцы (если они есть)
-        required_columns = [
-            "open",
-            "close",
-            "high",
-            "low",
-            "value",
-            "volume",
-            "begin",
-            "end",
-        ]
-        available_columns = [
-            col for col in required_columns if col in formatted_df.columns
-        ]
+    def _format_candles_columns(
+        self,
+        df: pd.DataFrame,
+        secid: str,
+        shortname: str,
+    ) -> dict[str, Any]:
+        """
+        Приводит свечи к стандартным столбцам без построения DataFrame.
 
-        # Создаем новый датафрейм с нужными столбцами
-        result_df = formatted_df[available_columns].copy()
-
-        # Добавляем недостающие столбцы с нулевыми значениями
-        for col in required_columns:
-            if col not in result_df.columns:
-                result_df[col] = 0.0 if col != "volume" else 0
-
-        # Добавляем идентификаторы
-        result_df["secid"] = secid
-        result_df["shortname"] = shortname
-
-        # Убеждаемся, что begin и end в правильном формате
-        if "begin" in result_df.columns:
-            result_df["begin"] = pd.to_datetime(result_df["begin"])
-        if "end" in result_df.columns:
-            result_df["end"] = pd.to_datetime(result_df["end"])
-
-        # Упорядочиваем столбцы
-        column_order = [
-            "open",
-            "close",
-            "high",
-            "low",
-            "value",
-            "volume",
-            "begin",
-            "end",
-            "secid",
-            "shortname",
-        ]
-        result_df = result_df[column_order]
+        Результат можно сразу передать в _concat_columnar, минуя промежуточный
+        датафрейм для каждой ценной бумаги.
+
+        Args:
+            df: Исходный датафрейм со свечами
+            secid: Тикер ценной бумаги
+            shortname: Краткое название ценной бумаги
+
+        Returns:
+            Словарь {столбец: массив} со столбцами: open, close, high, low, value, volume, begin, end, secid, shortname
+        """
+        # Собираем итоговые столбцы за один проход, без промежуточных копий.
+        # Столбцы в верхнем регистре (OPEN, CLOSE, ...) принимаются как есть.
+        n_rows = len(df)
+        # Числовые столбцы приводятся к float64, чтобы у всех наборов свечей
+        # была одинаковая схема и объединение не приводило типы.
+        columns: dict[str, Any] = {}
+        for col in self.CANDLES_COLUMNS:
+            source = col if col in df.columns else col.upper()
+            is_date = col in ("begin", "end")
+            if source in df.columns:
+                columns[col] = (
+                    df[source].to_numpy()
+                    if is_date
+                    else df[source].to_numpy(dtype=np.float64)
+                )
+            elif is_date:
+                # Недостающие даты - NaT, а не нулевая метка 1970-01-01
+                columns[col] = np.full(n_rows, np.datetime64("NaT", "ns"))
+            else:
+                # Недостающие столбцы заполняем нулевыми значениями
+                columns[col] = np.zeros(n_rows, dtype=np.float64)
+
+        # Приводим begin и end к datetime (единственное место преобразования).
+        # Строки ISS API имеют фиксированный формат - парсим по нему. Если
+        # в ответе встретились другие записи (например, только дата
+        # "2024-01-01"), разбираем смешанный формат, нераспознанное - NaT.
+        for col in ("begin", "end"):
+            values = columns[col]
+            if isinstance(values, np.ndarray) and values.dtype == object:
+                try:
+                    parsed = pd.to_datetime(
+                        values, format=self.ISS_DATETIME_FORMAT, cache=True
+                    )
+                except ValueError:
+                    parsed = pd.to_datetime(
+                        values, format="mixed", errors="coerce", cache=True
+                    )
+            else:
+                parsed = pd.to_datetime(values)
+            columns[col] = parsed.to_numpy()
 
-        return result_df
+        # Добавляем идентификаторы. В датафрейме одной бумаги они постоянны,
+        # поэтому хранятся как категории: один код int8 на строку
+        codes = np.zeros(n_rows, dtype=np.int8)
+        for col, value in (("secid", secid), ("shortname", shortname)):
+            # Пустой идентификатор (None/NaN) хранится как "": категория
+            # не может быть NaN
+            if value is None or pd.isna(value):
+                value = ""
+            columns[col] = pd.Categorical.from_codes(codes, categories=[value])
+
+        return columns
 
     async def _plot_candles_from_dataframe(
         self,
@@ -403,6 +747,10 @@ class MoexSecuritiesParser:
         """
         Строит графики из готового датафрейма.
 
+        Отрисовка выполняется в пуле потоков, чтобы не блокировать цикл событий.
+        Интерактивные бэкенды matplotlib работают только в главном потоке,
+        поэтому для них графики строятся на месте.
+
         Args:
             df: Датафрейм со свечами
             secid: Тикер ценной бумаги
@@ -412,73 +760,101 @@ class MoexSecuritiesParser:
             Словарь с информацией о построенных графиках
         """
         try:
-
-            # Определяем формат оси X в зависимости от интервала
-            if interval == 1:  # 1 минута
-                date_format = mdates.DateFormatter("%Y-%m-%d %H:%M")
-                locator = mdates.MinuteLocator(interval=60)  # каждые 60 минут
-            elif interval == 10:  # 10 минут
-                date_format = mdates.DateFormatter("%Y-%m-%d %H:%M")
-                locator = mdates.HourLocator(interval=1)  # каждый час
-            elif interval == 60:  # 1 час
-                date_format = mdates.DateFormatter("%Y-%m-%d %H:%M")
-                locator = mdates.HourLocator(interval=6)  # каждые 6 часов
-            elif interval == 24:  # 1 день
-                date_format = mdates.DateFormatter("%Y-%m-%d")
-                locator = mdates.DayLocator(interval=max(1, len(df) // 30))  # адаптивно
-            elif interval == 7:  # 1 неделя
-                date_format = mdates.DateFormatter("%Y-%m-%d")
-                locator = mdates.WeekLocator()
-            elif interval in [31, 4, 12]:  # месяц, квартал, год
-                date_format = mdates.DateFormatter("%Y-%m")
-                locator = mdates.MonthLocator(interval=max(1, interval // 24))
+            if plt.get_backend().lower() in _NON_INTERACTIVE_BACKENDS:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(
+                    None, self._render_candles_sync, df, secid, interval
+                )
             else:
-                date_format = mdates.DateFormatter("%Y-%m-%d")
-                locator = mdates.AutoDateLocator()
-
-            # График 1: Цены закрытия
-            fig, ax = plt.subplots(figsize=(12, 5))
-            ax.plot(df["begin"], df["close"], label=f"{secid} close", linewidth=1.5)
-            ax.set_xlabel("Дата", fontsize=11)
-            ax.set_ylabel("Цена, RUB", fontsize=11)
-            ax.set_title(f"{secid} — цены закрытия", fontsize=12, fontweight="bold")
-            ax.grid(True, alpha=0.3)
-            ax.legend()
-
-            # Применяем форматирование оси X
-            ax.xaxis.set_major_formatter(date_format)
-            ax.xaxis.set_major_locator(locator)
-            plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha="right")
-            plt.tight_layout()
-            plt.show()
-
-            # Вычисляем доходность
-            df["ret_simple"] = df["close"].pct_change()
-            df["ret_log"] = np.log(df["close"] / df["close"].shift(1))
-
-            # График 2: Доходность
-            fig, ax = plt.subplots(figsize=(12, 5))
-            ax.plot(df["begin"], df["ret_simple"], label="Daily return", linewidth=1.5)
-            ax.axhline(0, color="black", linewidth=0.8, linestyle="--")
-            ax.set_xlabel("Дата", fontsize=11)
-            ax.set_ylabel("Доходность", fontsize=11)
-            ax.set_title("Доходность по цене закрытия", fontsize=12, fontweight="bold")
-            ax.grid(True, alpha=0.3)
-            ax.legend()
-
-            # Применяем форматирование оси X
-            ax.xaxis.set_major_formatter(date_format)
-            ax.xaxis.set_major_locator(locator)
-            plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha="right")
-            plt.tight_layout()
-            plt.show()
+                self._render_candles_sync(df, secid, interval)
 
             return {"charts_generated": True}
         except Exception as e:
-            print(f"Ошибка при построении графиков: {e}")
-            traceback.print_exc()
+            logger.exception("Ошибка при построении графиков")
             return {"charts_generated": False, "error": str(e)}
 
+    def _render_candles_sync(
+        self,
+        df: pd.DataFrame,
+        secid: str,
+        interval: int,
+    ) -> None:
+        """
+        Синхронно строит графики цен закрытия и доходности.
+
+        Args:
+            df: Датафрейм со свечами (дополняется столбцами ret_simple, ret_log)
+            secid: Тикер ценной бумаги
+            interval: Интервал свечей для правильного форматирования оси X
+        """
+        # Определяем формат оси X в зависимости от интервала
+        if interval == 1:  # 1 минута
+            date_format = mdates.DateFormatter("%Y-%m-%d %H:%M")
+            locator = mdates.MinuteLocator(interval=60)  # каждые 60 минут
+        elif interval == 10:  # 10 минут
+            date_format = mdates.DateFormatter("%Y-%m-%d %H:%M")
+            locator = mdates.HourLocator(interval=1)  # каждый час
+        elif interval == 60:  # 1 час
+            date_format = mdates.DateFormatter("%Y-%m-%d %H:%M")
+            locator = mdates.HourLocator(interval=6)  # каждые 6 часов
+        elif interval == 24:  # 1 день
+            date_format = mdates.DateFormatter("%Y-%m-%d")
+            locator = mdates.DayLocator(interval=max(1, len(df) // 30))  # адаптивно
+        elif interval == 7:  # 1 неделя
+            date_format = mdates.DateFormatter("%Y-%m-%d")
+            locator = mdates.WeekLocator()
+        elif interval in [31, 4, 12]:  # месяц, квартал, год
+            date_format = mdates.DateFormatter("%Y-%m")
+            locator = mdates.MonthLocator(interval=max(1, interval // 24))
+        else:
+            date_format = mdates.DateFormatter("%Y-%m-%d")
+            locator = mdates.AutoDateLocator()
+
+        # Вычисляем доходность
+        # (одно деление на массиве используется для обеих доходностей)
+        close = df["close"].to_numpy(dtype=np.float64)
+        ratio = close[1:] / close[:-1]
+        ret_simple = np.empty_like(close)
+        ret_simple[:1] = np.nan
+        ret_simple[1:] = ratio - 1.0
+        ret_log = np.empty_like(close)
+        ret_log[:1] = np.nan
+        ret_log[1:] = np.log(ratio)
+        df["ret_simple"] = ret_simple
+        df["ret_log"] = ret_log
+
+        begin = df["begin"].to_numpy()
+
+        # Оба графика на одной фигуре с общей осью X
+        fig, (price_ax, returns_ax) = plt.subplots(
+            2, 1, figsize=(12, 10), sharex=True
+        )
+
+        # График 1: Цены закрытия
+        price_ax.plot(begin, close, label=f"{secid} close", linewidth=1.5)
+        price_ax.set_ylabel("Цена, RUB", fontsize=11)
+        price_ax.set_title(f"{secid} — цены закрытия", fontsize=12, fontweight="bold")
+        price_ax.grid(True, alpha=0.3)
+        price_ax.legend()
+
+        # График 2: Доходность
+        returns_ax.plot(begin, ret_simple, label="Daily return", linewidth=1.5)
+        returns_ax.axhline(0, color="black", linewidth=0.8, linestyle="--")
+        returns_ax.set_xlabel("Дата", fontsize=11)
+        returns_ax.set_ylabel("Доходность", fontsize=11)
+        returns_ax.set_title(
+            "Доходность по цене закрытия", fontsize=12, fontweight="bold"
+        )
+        returns_ax.grid(True, alpha=0.3)
+        returns_ax.legend()
+
+        # Применяем форматирование общей оси X
+        returns_ax.xaxis.set_major_formatter(date_format)
+        returns_ax.xaxis.set_major_locator(locator)
+        plt.setp(returns_ax.xaxis.get_majorticklabels(), rotation=45, ha="right")
+        fig.tight_layout()
+        plt.show()
+
     async def get_and_plot_candles(
         self,
         secid: str,
@@ -505,24 +881,23 @@ class MoexSecuritiesParser:
         # Получаем данные
         df = await self.get_candles(secid, board, date_from, date_till, interval)
 
-        print("\nРезультат загрузки данных:")
-        print(f"   Тикер: {secid}")
-        print(f"   Площадка: {board}")
-        print(f"   Период: {date_from} - {date_till}")
-        print(f"   Размер DataFrame: {df.shape if not df.empty else 'пуст'}")
+        logger.debug(
+            "Результат загрузки данных: тикер %s, площадка %s, период %s - %s, "
+            "строк: %d",
+            secid,
+            board,
+            date_from,
+            date_till,
+            len(df),
+        )
 
         if df.empty:
-            print("\nDataFrame пуст. Проводим диагностику...")
-            print(f"   Тикер: {secid}")
-            print(f"   Площадка: {board}")
-            print(f"   Период: {date_from} - {date_till}")
-
             # Проверяем информацию о тикере для определения правильной площадки
-            print(f"\nПроверяем информацию о тикере {secid} в базе MOEX...")
+            logger.debug("DataFrame пуст, проверяем тикер %s в базе MOEX", secid)
             try:
                 sec_info = await self.get_securities_info(secid)
                 if not sec_info.empty:
-                    print(f"   Найдено записей: {len(sec_info)}")
+                    logger.debug("Найдено записей: %d", len(sec_info))
                     # Ищем точное совпадение по secid
                     matching = sec_info[sec_info["secid"] == secid]
                     if matching.empty:
@@ -534,66 +909,67 @@ class MoexSecuritiesParser:
                         ]
 
                     if not matching.empty:
-                        print(f"   📋 Найденные записи для тикера {secid}:")
-                        for idx, row in matching.head(5).iterrows():
-                            secid_val = row.get("secid", "N/A")
-                            # Используем primary_boardid как основной источник
-                            board_val = row.get("primary_boardid", "N/A")
-                            if board_val == "N/A" or pd.isna(board_val):
-                                # Запасной вариант - board
-                                board_val = row.get("board", "N/A")
-                            type_val = row.get("type", "N/A")
-                            name_val = row.get("shortname") or row.get("name", "N/A")
-                            isin_val = row.get("isin", "N/A")
-                            print(f"     - {name_val}")
-                            print(
-                                f"       Тикер: {secid_val}, Площадка (primary_boardid): {board_val}"
+                        # Отбираем нужные столбцы один раз (недостающие -> "N/A")
+                        candidates = (
+                            matching.head(5)
+                            .reindex(columns=self.DIAGNOSTIC_COLUMNS)
+                            .astype(object)
+                            .fillna("N/A")
+                        )
+                        # Площадки-кандидаты без повторов, в порядке записей
+                        candidate_boards: dict[str, None] = {}
+                        for row in candidates.itertuples(index=False):
+                            # Используем primary_boardid как основной источник,
+                            # board - запасной вариант
+                            board_val = (
+                                row.primary_boardid
+                                if row.primary_boardid != "N/A"
+                                else row.board
+                            )
+                            logger.debug(
+                                "Найдена запись: %s (тикер %s, площадка %s, тип %s, ISIN %s)",
+                                row.shortname if row.shortname != "N/A" else row.name,
+                                row.secid,
+                                board_val,
+                                row.type,
+                                row.isin,
+                            )
+                            if board_val and board_val not in ("N/A", board):
+                                candidate_boards[str(board_val)] = None
+
+                        # Пробуем все площадки из данных MOEX одновременно
+                        if candidate_boards:
+                            logger.debug(
+                                "Пробуем площадки из данных MOEX: %s",
+                                list(candidate_boards),
+                            )
+                            df = await self._probe_boards(
+                                secid,
+                                list(candidate_boards),
+                                date_from,
+                                date_till,
+                                interval,
                             )
-                            print(f"       Тип: {type_val}, ISIN: {isin_val}")
-
-                            # Пробуем использовать правильную площадку
-                            if (
-                                board_val != "N/A"
-                                and board_val != board
-                                and board_val
-                                and not pd.isna(board_val)
-                            ):
-                                print(
-                                    f"   🔄 Пробуем площадку из данных MOEX: {board_val}"
-                                )
-                                df_retry = await self.get_candles(
-                                    secid, str(board_val), date_from, date_till, interval
-                                )
-                                if not df_retry.empty:
-                                    print(
-                                        f"   Данные найдены на площадке {board_val}!"
-                                    )
-                                    df = df_retry
-                                    break
                     else:
-                        print(f"   Точное совпадение для тикера {secid} не найдено")
-                        print(
-                            f"   Всего найдено записей с похожим названием: {len(sec_info)}"
+                        logger.debug(
+                            "Точное совпадение для тикера %s не найдено "
+                            "(записей с похожим названием: %d)",
+                            secid,
+                            len(sec_info),
                         )
                 else:
-                    print(f"   Тикер {secid} не найден в базе MOEX")
-                    print(
-                        "   Проверьте правильность тикера. Возможно, нужно использовать другой тикер."
-                    )
-            except Exception as e:
-                print(f"   Ошибка при проверке тикера: {e}")
-                traceback.print_exc()
+                    logger.debug("Тикер %s не найден в базе MOEX", secid)
+            except Exception:
+                logger.exception("Ошибка при проверке тикера %s", secid)
 
             if df.empty:
-                print(f"\nНе удалось получить данные для тикера {secid}")
-                print("   Возможные причины:")
-                print(f"   1. Тикер не торгуется на площадке {board}")
-                print("   2. Нет данных за указанный период")
-                print(
-                    "   3. Для этого типа инструмента (фиксинг/индекс) нет исторических данных"
-                )
-                print(
-                    "   4. Попробуйте выбрать другую ценную бумагу (акцию вместо фиксинга)"
+                logger.warning(
+                    "Не удалось получить данные для тикера %s (площадка %s, "
+                    "период %s - %s)",
+                    secid,
+                    board,
+                    date_from,
+                    date_till,
                 )
 
                 return {
@@ -603,12 +979,8 @@ class MoexSecuritiesParser:
                     "error": f"Нет данных для построения графиков. Тикер: {secid}, Площадка: {board}, Период: {date_from} - {date_till}",
                 }
 
-        print(f"Данные успешно получены: {len(df)} записей")
-        if "begin" in df.columns:
-            print(f"   Период данных: {df['begin'].min()} - {df['begin'].max()}")
-
-        # Конвертируем дату
-        df["begin"] = pd.to_datetime(df["begin"])
+        # Форматируем датафрейм к стандартному виду
+        df = self._format_candles_dataframe(df, secid, secid)
 
         charts_info = {
             "secid": secid,
@@ -616,10 +988,6 @@ class MoexSecuritiesParser:
             "charts_generated": False,
         }
 
-        # Форматируем датафрейм к стандартному виду
-        df = self._format_candles_dataframe(df, secid, secid)
-        charts_info["candles"] = df
-
         if plot and not df.empty:
             try:
                 charts_plot_result = await self._plot_candles_from_dataframe(
@@ -631,11 +999,101 @@ class MoexSecuritiesParser:
                 if "error" in charts_plot_result:
                     charts_info["error"] = charts_plot_result["error"]
             except Exception as e:
-                print(f"Ошибка при построении графиков: {e}")
+                logger.exception("Ошибка при построении графиков")
                 charts_info["error"] = str(e)
 
         return charts_info
 
+    def _resolve_fetch_targets(self, securities_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Определяет тикер, площадку и название для всех ценных бумаг сразу.
+
+        Тикер: secid, затем SECID, затем название. Площадка: primary_boardid
+        согласно структуре данных MOEX, затем board, затем TQBR по умолчанию.
+        Название: shortname, затем name.
+
+        Args:
+            securities_df: Датафрейм с ценными бумагами
+
+        Returns:
+            Датафрейм со столбцами secid, board, shortname (тот же индекс)
+        """
+        missing = pd.Series(np.nan, index=securities_df.index, dtype=object)
+
+        def column(name: str) -> pd.Series:
+            # Пустые строки считаем отсутствующими значениями
+            values = securities_df.get(name, missing).astype(object)
+            return values.where(values.ne(""))
+
+        shortname = column("shortname").combine_first(column("name")).fillna("")
+        secid = (
+            column("secid")
+            .combine_first(column("SECID"))
+            .combine_first(shortname)
+        )
+        board = (
+            column("primary_boardid")
+            .combine_first(column("board"))
+            .fillna("TQBR")
+            .astype(str)
+        )
+        return pd.DataFrame({"secid": secid, "board": board, "shortname": shortname})
+
+    async def _fetch_security_candles(
+        self,
+        secid: str,
+        board: str,
+        shortname: str,
+        date_from: str | None,
+        date_till: str | None,
+        interval: int,
+        semaphore: asyncio.Semaphore,
+    ) -> tuple[dict[str, Any] | None, dict[str, Any]]:
+        """
+        Загружает и форматирует свечи одной ценной бумаги.
+
+        Ничего не выводит в консоль: прогресс печатает interactive_parse.
+
+        Args:
+            secid: Тикер ценной бумаги
+            board: Торговая площадка
+            shortname: Краткое название ценной бумаги
+            date_from: Дата начала периода в формате "YYYY-MM-DD"
+            date_till: Дата окончания периода в формате "YYYY-MM-DD"
+            interval: Интервал свечей
+            semaphore: Семафор, ограничивающий число одновременных запросов
+
+        Returns:
+            Кортеж (столбцы свечей для _concat_columnar или None,
+            сведения о ценной бумаге)
+        """
+        # Получаем котировки (без построения графиков для каждой отдельно)
+        async with semaphore:
+            df = await self.get_candles(
+                secid=secid,
+                board=board,
+                date_from=date_from,
+                date_till=date_till,
+                interval=interval,
+            )
+
+        if df.empty:
+            return None, {
+                "secid": secid,
+                "shortname": shortname,
+                "rows_count": 0,
+                "error": "Данные не найдены",
+            }
+
+        # Приводим свечи к нужному формату сразу в виде столбцов: отдельный
+        # датафрейм на каждую бумагу не нужен, объединение идет по массивам
+        columns = self._format_candles_columns(df, secid, shortname)
+        return columns, {
+            "secid": secid,
+            "shortname": shortname,
+            "rows_count": len(df),
+        }
+
     async def interactive_parse(self) -> dict[str, Any]:
         """
         Интерактивный режим парсинга с вводом данных от пользователя.
@@ -649,10 +1107,10 @@ class MoexSecuritiesParser:
 
         # Выбор банка
         print("\nВыберите организацию, по которой хотели бы получить котировки:")
-        for key, value in self.BANK_NAMES.items():
-            print(f"{key}. {value['display']}")
+        for key, _, display in self._BANK_ITEMS:
+            print(f"{key}. {display}")
 
-        bank_choice = input("\nВведите цифру: ").strip()
+        bank_choice = (await asyncio.to_thread(input, "\nВведите цифру: ")).strip()
 
         if bank_choice not in self.BANK_NAMES:
             return {
@@ -686,6 +1144,7 @@ class MoexSecuritiesParser:
             filtered_securities = securities_df
         else:
             available_types = securities_df["type"].unique()
+            type_counts = securities_df["type"].value_counts(sort=False)
 
             print(f"\nНайдено {len(securities_df)} ценных бумаг")
             print("\nДоступные типы ценных бумаг:")
@@ -696,15 +1155,18 @@ class MoexSecuritiesParser:
                 # Используем display name если есть, иначе сам тип
                 display_name = self.TYPE_DISPLAY_NAMES.get(sec_type, sec_type)
                 type_options[str(idx)] = sec_type
-                securities_of_type = securities_df[securities_df["type"] == sec_type]
-                print(f"{idx}. {display_name} ({len(securities_of_type)} шт.)")
+                print(f"{idx}. {display_name} ({type_counts.get(sec_type, 0)} шт.)")
                 idx += 1
 
             if not type_options:
                 print("Не найдено известных типов ценных бумаг. Показываем все.")
                 filtered_securities = securities_df
             else:
-                type_choice = input("\nВведите номер типа ценной бумаги: ").strip()
+                type_choice = (
+                    await asyncio.to_thread(
+                        input, "\nВведите номер типа ценной бумаги: "
+                    )
+                ).strip()
 
                 if type_choice not in type_options:
                     return {
@@ -717,7 +1179,7 @@ class MoexSecuritiesParser:
 
                 selected_type = type_options[type_choice]
                 filtered_securities = securities_df[
-                    securities_df["type"] == selected_type
+                    securities_df["type"].eq(selected_type)
                 ]
 
         if filtered_securities is None or filtered_securities.empty:
@@ -759,43 +1221,59 @@ class MoexSecuritiesParser:
             else:
                 shortnames = [str(i) for i in range(len(filtered_securities))]
 
-        for i, shortname in enumerate(shortnames, 1):
-            row = filtered_securities.iloc[i - 1]
-            secid_val = (
-                row.get("secid")
-                if "secid" in row.index
-                else (row.get("SECID") if "SECID" in row.index else "")
-            )
-            # Показываем также primary_boardid для информации
-            board_val = (
-                row.get("primary_boardid") if "primary_boardid" in row.index else None
+        # Позиции нужных столбцов вычисляем один раз, строки читаем как кортежи
+        col_pos = {
+            name: filtered_securities.columns.get_loc(name)
+            for name in ("secid", "SECID", "primary_boardid", "board")
+            if name in filtered_securities.columns
+        }
+        secid_pos = col_pos.get("secid", col_pos.get("SECID"))
+        # Показываем также primary_boardid (или board) для информации
+        board_positions = [
+            col_pos[name] for name in ("primary_boardid", "board") if name in col_pos
+        ]
+
+        rows = filtered_securities.itertuples(index=False, name=None)
+        for i, (shortname, row) in enumerate(zip(shortnames, rows), 1):
+            secid_val = row[secid_pos] if secid_pos is not None else ""
+            board_val = next(
+                (
+                    row[pos]
+                    for pos in board_positions
+                    if row[pos] and not _is_nan(row[pos])
+                ),
+                None,
             )
-            if not board_val or pd.isna(board_val):
-                board_val = row.get("board") if "board" in row.index else None
 
             if secid_val:
-                board_info = (
-                    f", площадка: {board_val}"
-                    if board_val and not pd.isna(board_val)
-                    else ""
-                )
+                board_info = f", площадка: {board_val}" if board_val else ""
                 print(f"{i}. {shortname} (тикер: {secid_val}{board_info})")
             else:
                 print(f"{i}. {shortname}")
 
         print("0. Все ценные бумаги")
 
-        security_choice = input("\nВведите номер ценной бумаги (0 для всех): ").strip()
+        security_choice = (
+            await asyncio.to_thread(
+                input, "\nВведите номер ценной бумаги (0 для всех): "
+            )
+        ).strip()
 
         # Ввод периода дат
         print("\n📅 Введите период для получения котировок:")
-        date_from = input(
-            "Дата начала (YYYY-MM-DD) или Enter для последнего года: "
+        date_from = (
+            await asyncio.to_thread(
+                input, "Дата начала (YYYY-MM-DD) или Enter для последнего года: "
+            )
         ).strip()
         if not date_from:
             date_from = None
 
-        date_till = input("Дата окончания (YYYY-MM-DD) или Enter для сегодня: ").strip()
+        date_till = (
+            await asyncio.to_thread(
+                input, "Дата окончания (YYYY-MM-DD) или Enter для сегодня: "
+            )
+        ).strip()
         if not date_till:
             date_till = None
 
@@ -810,42 +1288,22 @@ class MoexSecuritiesParser:
         print("7.  1 квартал")
         print("8.  1 год")
 
-        interval_choice = input(
-            "\nВведите номер интервала (1-8, по умолчанию 4): "
+        interval_choice = (
+            await asyncio.to_thread(
+                input, "\nВведите номер интервала (1-8, по умолчанию 4): "
+            )
         ).strip()
-        interval_map = {
-            "1": 1,  # 1 минута
-            "2": 10,  # 10 минут
-            "3": 60,  # 1 час
-            "4": 24,  # 1 день
-            "5": 7,  # 1 неделя
-            "6": 31,  # 1 месяц
-            "7": 4,  # 1 квартал
-            "8": 12,  # 1 год
-        }
-        interval = interval_map.get(interval_choice, 24)
+        interval = self.INTERVAL_CHOICES.get(interval_choice, 24)
 
         # Определяем название интервала для вывода
-        interval_names = {
-            1: "1 минута",
-            10: "10 минут",
-            60: "1 час",
-            24: "1 день",
-            7: "1 неделя",
-            31: "1 месяц",
-            4: "1 квартал",
-            12: "1 год",
-        }
-        interval_name = interval_names.get(interval, f"{interval}")
+        interval_name = self.INTERVAL_NAMES.get(interval, f"{interval}")
         print(f"Выбран интервал: {interval_name}")
 
         # Определяем какие ценные бумаги обрабатывать
-        selected_securities = []
-
         if security_choice == "0":
             # Обрабатываем все ценные бумаги
             print(f"\nОбработка всех {len(filtered_securities)} ценных бумаг...")
-            selected_securities = filtered_securities.to_dict("records")
+            selected_securities = filtered_securities
         else:
             try:
                 security_idx = int(security_choice) - 1
@@ -857,8 +1315,10 @@ class MoexSecuritiesParser:
                         "candles": pd.DataFrame(),
                         "charts_generated": False,
                     }
-                selected_security_row = filtered_securities.iloc[security_idx]
-                selected_securities = [selected_security_row.to_dict()]
+                # Срез из одной строки - представление, без копирования данных
+                selected_securities = filtered_securities.iloc[
+                    security_idx : security_idx + 1
+                ]
             except (ValueError, IndexError):
                 return {
                     "error": f"Неверный формат номера или индекс вне диапазона: {security_choice}",
@@ -868,120 +1328,75 @@ class MoexSecuritiesParser:
                     "charts_generated": False,
                 }
 
-        # Собираем данные по всем выбранным ценным бумагам
-        all_candles_dfs = []
-        processed_securities = []
-
-        for idx, security_row in enumerate(selected_securities):
-            # Преобразуем dict обратно в Series для удобства работы
-            if isinstance(security_row, dict):
-                security_row = pd.Series(security_row)
-
-            selected_shortname = (
-                security_row.get("shortname")
-                if "shortname" in security_row.index
-                else security_row.get("name", "")
+        # Тикер, площадка и название определяются векторно и только
+        # для выбранных бумаг
+        selected_targets = self._resolve_fetch_targets(selected_securities)
+
+        # Собираем данные по всем выбранным ценным бумагам (параллельно)
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        total = len(selected_targets)
+
+        async def fetch_with_progress(
+            idx: int, secid: str, board: str, shortname: str
+        ) -> tuple[dict[str, Any] | None, dict[str, Any]]:
+            # Прогресс печатается только здесь, в консольном режиме:
+            # _fetch_security_candles в консоль не пишет
+            columns, security_info = await self._fetch_security_candles(
+                secid, board, shortname, date_from, date_till, interval, semaphore
+            )
+            # Строки прогресса выводятся одним блоком после загрузки: при
+            # параллельных запросах это одна запись в stdout на бумагу, и
+            # строки разных бумаг не перемешиваются
+            label = f"[{idx + 1}/{total}]"
+            status = (
+                "данные не найдены"
+                if columns is None
+                else f"получено {security_info['rows_count']} записей"
             )
-
-            # Получаем secid из строки DataFrame
-            secid = None
-            if "secid" in security_row.index:
-                secid = security_row["secid"]
-            elif "SECID" in security_row.index:
-                secid = security_row["SECID"]
-
-            # Если secid не найден или пустой, используем shortname
-            if not secid or (isinstance(secid, float) and pd.isna(secid)):
-                secid = selected_shortname
-
-            # Получаем торговую площадку из данных о ценной бумаге
-            # Используем primary_boardid согласно структуре данных MOEX
-            board_from_data = None
-            if "primary_boardid" in security_row.index:
-                board_val = security_row.get("primary_boardid")
-                if board_val is not None and not pd.isna(board_val):
-                    board_from_data = str(board_val)
-            # Если primary_boardid нет, пробуем board как запасной вариант
-            if not board_from_data and "board" in security_row.index:
-                board_val = security_row.get("board")
-                if board_val is not None and not pd.isna(board_val):
-                    board_from_data = str(board_val)
-            # Если ничего не нашли, используем TQBR по умолчанию
-            if not board_from_data:
-                board_from_data = "TQBR"
-
             print(
-                f"\n📈 [{idx + 1}/{len(selected_securities)}] Загрузка данных для {selected_shortname} (тикер: {secid}, площадка: {board_from_data})..."
+                f"\n📈 {label} Загрузка данных для {shortname} (тикер: {secid}, площадка: {board})...\n"
+                f"   {label} {secid}: {status}"
             )
+            return columns, security_info
 
-            # Получаем котировки (без построения графиков для каждой отдельно)
-            df = await self.get_candles(
-                secid=secid,
-                board=board_from_data,
-                date_from=date_from,
-                date_till=date_till,
-                interval=interval,
+        results = await asyncio.gather(
+            *(
+                fetch_with_progress(idx, target.secid, target.board, target.shortname)
+                for idx, target in enumerate(selected_targets.itertuples(index=False))
             )
+        )
 
-            if not df.empty:
-                # Приводим датафрейм к нужному формату
-                df = self._format_candles_dataframe(df, secid, selected_shortname)
-                all_candles_dfs.append(df)
-                processed_securities.append(
-                    {
-                        "secid": secid,
-                        "shortname": selected_shortname,
-                        "rows_count": len(df),
-                    }
-                )
-                print(f"   Получено {len(df)} записей")
-            else:
-                print("   Данные не найдены")
-                processed_securities.append(
-                    {
-                        "secid": secid,
-                        "shortname": selected_shortname,
-                        "rows_count": 0,
-                        "error": "Данные не найдены",
-                    }
-                )
-
-        # Объединяем все датафреймы
-        if all_candles_dfs:
-            combined_df = pd.concat(all_candles_dfs, ignore_index=True)
-
-            # Сортируем по дате начала
-            if "begin" in combined_df.columns:
-                combined_df["begin"] = pd.to_datetime(combined_df["begin"])
-                combined_df = combined_df.sort_values("begin").reset_index(drop=True)
+        # asyncio.gather возвращает результаты в исходном порядке ценных бумаг,
+        # списки строятся за один проход без поэлементного append
+        processed_securities = [security_info for _, security_info in results]
+        all_candles_columns = [columns for columns, _ in results if columns]
+        del results
+
+        # Объединяем данные всех бумаг
+        if all_candles_columns:
+            frames_count = len(all_candles_columns)
+            # Сортируем по дате начала при объединении (begin уже приведен
+            # к datetime в _format_candles_dataframe)
+            combined_df = _concat_columnar(all_candles_columns, sort_by="begin")
+            # Столбцы отдельных бумаг больше не нужны - освобождаем их,
+            # чтобы при построении графиков в памяти оставалась только
+            # итоговая таблица
+            all_candles_columns.clear()
 
             print(
-                f"\nИтого получено {len(combined_df)} записей по {len(all_candles_dfs)} ценным бумагам"
+                f"\nИтого получено {len(combined_df)} записей по {frames_count} ценным бумагам"
             )
 
             # Строим графики только если выбрана одна ценная бумага
             charts_generated = False
-            if len(selected_securities) == 1 and not combined_df.empty:
+            if total == 1 and not combined_df.empty:
                 print("\nПостроение графиков...")
                 charts_info = await self._plot_candles_from_dataframe(
                     combined_df, processed_securities[0]["secid"], interval=interval
                 )
                 charts_generated = charts_info.get("charts_generated", False)
         else:
-            combined_df = pd.DataFrame(
-                columns=[
-                    "open",
-                    "close",
-                    "high",
-                    "low",
-                    "value",
-                    "volume",
-                    "begin",
-                    "end",
-                    "secid",
-                    "shortname",
-                ]
-            )
+            combined_df = _EMPTY_CANDLES.copy()
             charts_generated = False
 
         return {
@@ -30,26 +30,159 @@
 """
 
 import asyncio
-import os
-import random
-import shutil
-from pathlib import Path
+import copy
+import logging
+import re
 from typing import Any
-import traceback
+from concurrent.futures import ThreadPoolExecutor
+import httpx
+from bs4 import BeautifulSoup, Tag
 from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.firefox.remote_connection import FirefoxRemoteConnection
+from selenium.webdriver.remote.client_config import ClientConfig
 from selenium.webdriver.remote.webdriver import WebDriver
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
+from selenium.webdriver.support.ui import WebDriverWait
+
+from core.parsers.sberbank_selenium import (
+    DriverPoolKey,
+    PageCacheMixin,
+    browser_installed,
+    build_chrome_options,
+    chrome_driver_path,
+    chrome_profiles,
+    driver_pool,
+    gecko_driver_path,
+)
+
+# Тексты кнопок карточки: оформление карты и подробная информация
+_APPLY_TEXT_RE = re.compile("Оформить|Подать|Выбрать")
+_DETAILS_TEXT_RE = re.compile("Подробнее|Узнать")
+
+
+logger = logging.getLogger(__name__)
+
+
+# Единый скрипт сбора данных со страницы каталога: ожидание карточек,
+# прокрутка для lazy-loaded элементов, подсчет элементов и HTML каталога.
+# Выполняется одной командой WebDriver вместо отдельных запросов на каждый шаг.
+_COLLECT_CARDS_JS = """
+const certErrorMarkers = arguments[0];
+const done = arguments[arguments.length - 1];
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+const jitter = (min, max) => min + Math.random() * (max - min);
+
+const hasCards = () => !!document.querySelector('.product-card, .product-card__wrap');
+const checkReady = () => {
+    if (hasCards()) {
+        return true;
+    }
+    const text = document.body ? document.body.textContent : '';
+    return text.includes('Карта') ||
+           text.includes('кредит') ||
+           text.includes('кредитная');
+};
+const isReady = () => document.readyState === 'complete' && checkReady();
+
+// Ждем выполнения условия, проверяя его только при изменениях DOM
+const waitFor = (predicate, timeout) => new Promise((resolve) => {
+    if (predicate()) {
+        resolve(true);
+        return;
+    }
+    let finished = false;
+    let timer = null;
+    const observer = new MutationObserver(() => onChange());
+    const finish = (result) => {
+        if (finished) return;
+        finished = true;
+        observer.disconnect();
+        clearTimeout(timer);
+        document.removeEventListener('readystatechange', onChange);
+        resolve(result);
+    };
+    const onChange = () => {
+        if (predicate()) finish(true);
+    };
+    observer.observe(document.documentElement, {childList: true, subtree: true});
+    document.addEventListener('readystatechange', onChange);
+    timer = setTimeout(() => finish(predicate()), timeout);
+});
+
+const countElements = () => ({
+    cardWraps: document.querySelectorAll('.product-card__wrap').length,
+    productCards: document.querySelectorAll('.product-card').length,
+    productCatalog: !!document.querySelector('.product-catalog__product-cards'),
+    hasCatalog: !!document.querySelector('.product-catalog__product-cards, .product-catalog'),
+    hasHeading: document.querySelectorAll('.product-card__heading').length > 0,
+    bodyText: document.body ? document.body.textContent.substring(0, 500) : ''
+});
+
+const collect = async () => {
+    // Ждем до 20 секунд - без фиксированных пауз после загрузки страницы
+    const ready = (await waitFor(isReady, 20000)) || checkReady();
+
+    // Прокручиваем в конец страницы, пока число карточек не перестанет
+    // расти (два замера подряд), но не дольше 5 секунд
+    const scrollStarted = Date.now();
+    let lastCount = -1;
+    let stableTicks = 0;
+    while (stableTicks < 2 && Date.now() - scrollStarted < 5000) {
+        window.scrollTo(0, document.body.scrollHeight);
+        // Небольшая случайная пауза между прокрутками
+        await sleep(jitter(200, 400));
+        const count = document.querySelectorAll('.product-card').length;
+        if (count === lastCount) {
+            stableTicks++;
+        } else {
+            stableTicks = 0;
+            lastCount = count;
+        }
+    }
+
+    let counts = countElements();
+    let retried = false;
+    if (counts.cardWraps === 0 && counts.productCards === 0) {
+        // Элементы все еще не найдены после прокрутки - ждем их появления
+        await waitFor(hasCards, 3000);
+        counts = countElements();
+        retried = true;
+    }
+
+    // Карточки разбираются в Python: возвращаем только HTML каталога
+    const catalog = document.querySelector('.product-catalog__product-cards') ||
+                    document.querySelector('.product-catalog') ||
+                    document.body;
+    // Страница с ошибкой сертификатов Минцифры
+    const pageText = document.body ? document.body.innerText : '';
+    const certError = certErrorMarkers.some((marker) => pageText.includes(marker));
+
+    // Скрипты, стили и иконки при разборе не нужны - не передаем их через WebDriver
+    let catalogHtml = '';
+    if (catalog) {
+        const copy = catalog.cloneNode(true);
+        copy.querySelectorAll('script, style, noscript, svg').forEach((node) => node.remove());
+        catalogHtml = copy.outerHTML;
+    }
+
+    return {
+        ready,
+        counts,
+        retried,
+        certError,
+        catalogHtml,
+        title: document.title
+    };
+};
+
+collect().then(done, (e) => done({error: String(e)}));
+"""
 
 
-class SberbankCreditCardSeleniumParser:
+class SberbankCreditCardSeleniumParser(PageCacheMixin):
     """
     Парсер кредитных карт Сбербанка на основе Selenium.
 
@@ -67,6 +200,67 @@ class SberbankCreditCardSeleniumParser:
     DEFAULT_TIMEOUT = 30.0
     DEFAULT_VIEWPORT_WIDTH = 1920
     DEFAULT_VIEWPORT_HEIGHT = 1080
+    # Таймаут асинхронных скриптов: ожидание карточек (до 20 с) плюс прокрутка
+    SCRIPT_TIMEOUT = 60.0
+    # Размер пула HTTP-соединений с драйвером (chromedriver/geckodriver)
+    CONNECTION_POOL_SIZE = 20
+    # Сколько вкладок parse_pages загружает одновременно
+    MAX_TABS = 4
+    # Потоки для блокирующих вызовов Selenium: команды одного драйвера
+    # выполняются последовательно, больше двух потоков не нужно
+    EXECUTOR_WORKERS = 2
+
+    # Браузеры переиспользуются между экземплярами парсера
+    _pool = driver_pool
+
+    CHROME_USER_AGENT = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+    )
+    # Признаки страницы с ошибкой сертификатов Минцифры
+    CERT_ERROR_MARKERS = (
+        "Возникла проблема при открытии сайта Сбербанка",
+        "не установлены сертификаты Национального УЦ Минцифры",
+    )
+    # Ресурсы, не нужные для извлечения текста карточек (изображения, шрифты,
+    # счетчики аналитики) - браузер их не загружает
+    BLOCKED_URL_PATTERNS = (
+        "*.png",
+        "*.jpg",
+        "*.jpeg",
+        "*.webp",
+        "*.gif",
+        "*.svg",
+        "*.woff*",
+        "*.ttf",
+        "*google-analytics*",
+        "*googletagmanager*",
+        "*yandex.ru/metrika*",
+        "*mc.yandex*",
+        "*doubleclick*",
+    )
+    BASE_URL = "https://www.sberbank.ru"
+    CATALOG_URL = "https://www.sberbank.ru/ru/person/bank_cards/credit_cards"
+    # CSS-селекторы элементов карточки (общие для всех карточек и методов)
+    HEADING_SELECTORS = (
+        ".product-card__content_inner .product-card__heading",
+        ".product-card__content_outer .product-card__heading",
+        ".product-card__heading",
+    )
+    # Описание, особенности и кнопки карточки выбираются одним запросом
+    CARD_PARTS_SELECTOR = (
+        ".product-card__description, .product-card__factoids .factoid, "
+        ".product-card__buttons a"
+    )
+    # Приоритет описаний: из внутреннего блока, затем из внешнего, затем любое
+    DESCRIPTION_CONTAINERS = ("product-card__content_inner", "product-card__content_outer")
+    FACTOID_HEADING_SELECTOR = "h3.dk-sbol-heading"
+    # Подписи factoid: сначала варианты tooltip, затем описания
+    FACTOID_LABEL_SELECTOR = (
+        ".factoid__tooltip .dk-sbol-text p, .factoid__tooltip .dk-sbol-text span, "
+        ".factoid__tooltip .dk-sbol-text, .factoid__description .dk-sbol-text p, "
+        ".factoid__description .dk-sbol-text span, .factoid__description .dk-sbol-text"
+    )
 
     def __init__(
         self,
@@ -81,17 +275,19 @@ class SberbankCreditCardSeleniumParser:
 
         Args:
             headless: Запуск в headless режиме
-            chrome_profile_path: Путь к профилю Firefox (оставлено для совместимости, не используется)
+            chrome_profile_path: Каталог профиля Chrome (--user-data-dir); если не указан,
+                используется временный профиль, общий для процесса
             viewport_width: Ширина окна браузера
             viewport_height: Высота окна браузера
             timeout: Таймаут для операций в секундах
         """
         self.headless = headless
-        self.chrome_profile_path = chrome_profile_path  # Оставлено для совместимости
+        self.chrome_profile_path = chrome_profile_path
         self.viewport_width = viewport_width
         self.viewport_height = viewport_height
         self.timeout = timeout
         self._driver: WebDriver | None = None
+        self._executor: ThreadPoolExecutor | None = None
 
     def _check_browser_installed(self, browser_name: str) -> bool:
         """
@@ -103,37 +299,7 @@ class SberbankCreditCardSeleniumParser:
         Returns:
             True, если браузер установлен, False в противном случае
         """
-        if browser_name.lower() == 'chrome':
-            chrome_path = shutil.which('chrome') or shutil.which('google-chrome') or shutil.which('chromium')
-            if chrome_path:
-                return True
-
-            if os.name == 'nt':
-                chrome_paths = [
-                    Path("C:/Program Files/Google/Chrome/Application/chrome.exe"),
-                    Path("C:/Program Files (x86)/Google/Chrome/Application/chrome.exe"),
-                    Path.home() / "AppData/Local/Google/Chrome/Application/chrome.exe",
-                ]
-                for path in chrome_paths:
-                    if path.exists():
-                        return True
-
-        elif browser_name.lower() == 'firefox':
-            firefox_path = shutil.which('firefox') or shutil.which('mozilla-firefox')
-            if firefox_path:
-                return True
-
-            if os.name == 'nt':
-                firefox_paths = [
-                    Path("C:/Program Files/Mozilla Firefox/firefox.exe"),
-                    Path("C:/Program Files (x86)/Mozilla Firefox/firefox.exe"),
-                    Path.home() / "AppData/Local/Mozilla Firefox/firefox.exe",
-                ]
-                for path in firefox_paths:
-                    if path.exists():
-                        return True
-
-        return False
+        return browser_installed(browser_name.lower())
 
     def _get_available_browser(self) -> str | None:
         """
@@ -148,21 +314,72 @@ class SberbankCreditCardSeleniumParser:
             return 'firefox'
         return None
 
-    def _get_firefox_profile_path(self) -> str | None:
+    def _configure_connection_pool(self, driver: WebDriver) -> None:
         """
-        Получить путь к профилю Firefox пользователя.
+        Расширить пул keep-alive соединений между Selenium и драйвером браузера.
 
-        Returns:
-            Путь к профилю Firefox или None, если не найден
-        """
-        if os.name == 'nt':  # Windows
-            firefox_profiles = Path.home() / "AppData" / "Roaming" / "Mozilla" / "Firefox" / "Profiles"
-            if firefox_profiles.exists():
-                for profile_dir in firefox_profiles.iterdir():
-                    if profile_dir.is_dir() and (profile_dir.name.endswith('.default') or
-                                                  profile_dir.name.endswith('.default-release')):
-                        return str(profile_dir)
-        return None
+        По умолчанию urllib3 держит одно соединение на хост, и при параллельных
+        командах лишние соединения открываются заново и закрываются после
+        ответа. Драйвер получает новое соединение с ClientConfig, пул которого
+        вмещает CONNECTION_POOL_SIZE соединений.
+
+        Args:
+            driver: Экземпляр WebDriver (Chrome или Firefox)
+        """
+        old_executor = driver.command_executor
+        client_config = ClientConfig(
+            remote_server_addr=driver.service.service_url,
+            keep_alive=True,
+            timeout=old_executor.client_config.timeout,
+            init_args_for_pool_manager={
+                "init_args_for_pool_manager": {
+                    "maxsize": self.CONNECTION_POOL_SIZE,
+                    "block": False,
+                }
+            },
+        )
+        if isinstance(driver, webdriver.Firefox):
+            executor = FirefoxRemoteConnection(
+                remote_server_addr=client_config.remote_server_addr,
+                client_config=client_config,
+            )
+        else:
+            executor = ChromiumRemoteConnection(
+                remote_server_addr=client_config.remote_server_addr,
+                vendor_prefix="goog",
+                browser_name="chrome",
+                client_config=client_config,
+            )
+        driver.command_executor = executor
+        # Соединения прежнего пула больше не нужны
+        old_executor.close()
+
+    def _prepare_chrome_tab(self, driver: WebDriver) -> None:
+        """
+        Настроить текущую вкладку Chrome через CDP.
+
+        Команды CDP действуют только на вкладку, в которой выполнены, поэтому
+        вызываются для первой вкладки драйвера и для каждой вкладки parse_pages.
+
+        Args:
+            driver: Экземпляр WebDriver для Chrome
+        """
+        # Блокируем загрузку изображений, шрифтов и аналитики до рендера
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {
+            'urls': list(self.BLOCKED_URL_PATTERNS)
+        })
+
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+            'source': '''
+                Object.defineProperty(navigator, 'webdriver', {
+                    get: () => undefined
+                });
+                Object.defineProperty(navigator, 'platform', {
+                    get: () => 'Win32'
+                });
+            '''
+        })
 
     def _create_chrome_driver(self) -> WebDriver:
         """
@@ -171,49 +388,36 @@ class SberbankCreditCardSeleniumParser:
         Returns:
             Экземпляр WebDriver для Chrome
         """
-        chrome_options = ChromeOptions()
-
-        if self.headless:
-            chrome_options.add_argument("--headless=new")
-
-        chrome_options.add_argument(f"--window-size={self.viewport_width},{self.viewport_height}")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-setuid-sandbox")
-        chrome_options.add_argument("--lang=ru-RU")
-        chrome_options.add_argument("--start-maximized")
-
-        chrome_options.add_argument(
-            "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+        chrome_options = build_chrome_options(
+            self.headless, self.viewport_width, self.viewport_height, self.CHROME_USER_AGENT
         )
 
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_argument("--allow-running-insecure-content")
-        chrome_options.add_argument("--ignore-certificate-errors")
+        # Профиль с прогретым кэшем: явно указанный или временный общий
+        temp_profile_dir = None
+        if self.chrome_profile_path:
+            profile_dir = self.chrome_profile_path
+        else:
+            profile_dir = temp_profile_dir = chrome_profiles.acquire()
+        chrome_options.add_argument(f"--user-data-dir={profile_dir}")
 
-        print("Используется Chrome с системными сертификатами Windows и игнорированием ошибок сертификата")
+        logger.info("Используется Chrome с системными сертификатами Windows и игнорированием ошибок сертификата")
 
         try:
-            service = ChromeService(ChromeDriverManager().install())
+            service = ChromeService(chrome_driver_path())
             driver = webdriver.Chrome(service=service, options=chrome_options)
+            if temp_profile_dir is not None:
+                chrome_profiles.bind(driver.session_id, temp_profile_dir)
+                temp_profile_dir = None
+            driver.set_script_timeout(self.SCRIPT_TIMEOUT)
+            self._configure_connection_pool(driver)
 
-            driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
-                'source': '''
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => undefined
-                    });
-                    Object.defineProperty(navigator, 'platform', {
-                        get: () => 'Win32'
-                    });
-                '''
-            })
+            self._prepare_chrome_tab(driver)
 
             return driver
         except Exception as e:
-            print(f"\nОшибка при создании драйвера Chrome: {e}\n")
+            logger.error("Ошибка при создании драйвера Chrome: %s", e)
+            if temp_profile_dir is not None:
+                chrome_profiles.release(temp_profile_dir)
             raise
 
     def _create_firefox_driver(self) -> WebDriver:
@@ -224,6 +428,7 @@ class SberbankCreditCardSeleniumParser:
             Экземпляр WebDriver для Firefox
         """
         firefox_options = FirefoxOptions()
+        firefox_options.page_load_strategy = 'eager'
 
         if self.headless:
             firefox_options.add_argument("--headless")
@@ -238,13 +443,17 @@ class SberbankCreditCardSeleniumParser:
         firefox_options.set_preference("security.tls.insecure_fallback_hosts", "sberbank.ru,www.sberbank.ru")
         firefox_options.set_preference("security.tls.unrestricted_rc4_fallback", True)
         firefox_options.set_preference("security.enterprise_roots.enabled", True)
+        # Не загружаем изображения - для парсинга нужен только текст карточек
+        firefox_options.set_preference("permissions.default.image", 2)
 
-        print("Используется Firefox с системными сертификатами Windows")
+        logger.info("Используется Firefox с системными сертификатами Windows")
 
         try:
-            service = FirefoxService(GeckoDriverManager().install())
+            service = FirefoxService(gecko_driver_path())
             driver = webdriver.Firefox(service=service, options=firefox_options)
             driver.set_window_size(self.viewport_width, self.viewport_height)
+            driver.set_script_timeout(self.SCRIPT_TIMEOUT)
+            self._configure_connection_pool(driver)
 
             driver.execute_script("""
                 Object.defineProperty(navigator, 'webdriver', {
@@ -257,7 +466,7 @@ class SberbankCreditCardSeleniumParser:
 
             return driver
         except Exception as e:
-            print(f"\nОшибка при создании драйвера Firefox: {e}\n")
+            logger.error("Ошибка при создании драйвера Firefox: %s", e)
             raise
 
     def _create_driver(self) -> WebDriver:
@@ -279,13 +488,16 @@ class SberbankCreditCardSeleniumParser:
             try:
                 return self._create_chrome_driver()
             except Exception as chrome_error:
-                print(f"\nНе удалось создать драйвер Chrome: {chrome_error}")
-                print("Пробую использовать Firefox в качестве запасного варианта...")
+                logger.warning(
+                    "Не удалось создать драйвер Chrome: %s. "
+                    "Пробую использовать Firefox в качестве запасного варианта...",
+                    chrome_error,
+                )
                 if self._check_browser_installed('firefox'):
                     try:
                         return self._create_firefox_driver()
                     except Exception as firefox_error:
-                        print(f"\nНе удалось создать драйвер Firefox: {firefox_error}")
+                        logger.error("Не удалось создать драйвер Firefox: %s", firefox_error)
                         raise RuntimeError(
                             f"Не удалось создать драйвер ни для Chrome, ни для Firefox.\n"
                             f"Ошибки: Chrome - {chrome_error}, Firefox - {firefox_error}"
@@ -307,23 +519,44 @@ class SberbankCreditCardSeleniumParser:
 
         raise RuntimeError(f"Неподдерживаемый браузер: {browser}")
 
+    @property
+    def _pool_key(self) -> DriverPoolKey:
+        """Ключ пула драйверов для настроек этого парсера."""
+        return (type(self).__name__, self.headless, self.viewport_width, self.viewport_height)
+
+    @classmethod
+    def shutdown_pool(cls) -> None:
+        """Завершить все свободные браузеры общего пула (при выходе - автоматически)."""
+        cls._pool.shutdown()
+
     async def start(self) -> None:
-        """Инициализировать браузер."""
+        """Инициализировать браузер (свободный из пула или новый)."""
+        if self._executor is None:
+            # Собственный пул потоков: вызовы драйвера не ждут в очереди
+            # общего executor за посторонними задачами приложения
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.EXECUTOR_WORKERS, thread_name_prefix="sber-selenium"
+            )
         if self._driver is None:
-            # Selenium не поддерживает async напрямую, поэтому используем executor
-            loop = asyncio.get_event_loop()
-            self._driver = await loop.run_in_executor(None, self._create_driver)
-            print("Парсер кредитных карт Сбербанка инициализирован")
+            # Selenium не поддерживает async напрямую, поэтому пул создает
+            # драйвер в executor
+            self._driver = await self._pool.acquire(
+                self._pool_key, self._create_driver, self._executor
+            )
+            logger.info("Парсер кредитных карт Сбербанка инициализирован")
 
     async def close(self) -> None:
-        """Закрыть браузер и освободить ресурсы."""
+        """Вернуть браузер в пул для повторного использования."""
         if self._driver:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self._driver.quit)
+            await self._pool.release(self._pool_key, self._driver, self._executor)
             self._driver = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
 
     async def __aenter__(self):
-        await self.start()
+        # Браузер запускается лениво в parse_page: если каталог удается
+        # получить без браузера, драйвер не нужен вовсе
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -336,677 +569,583 @@ class SberbankCreditCardSeleniumParser:
             raise RuntimeError("Driver not initialized. Call start() first.")
         return self._driver
 
-    async def random_delay(self, min_delay: float = 0.5, max_delay: float = 2.0) -> None:
-        """Случайная задержка для имитации человеческого поведения."""
-        await asyncio.sleep(random.uniform(min_delay, max_delay))
+    def _normalize_link(self, link: str | None) -> str | None:
+        """
+        Привести ссылку карточки к абсолютному URL.
+
+        Args:
+            link: Ссылка из атрибута href (может быть относительной или якорной)
+
+        Returns:
+            Абсолютная ссылка или None
+        """
+        if not link or link.startswith(("http://", "https://")):
+            return link
+        if link[0] == "#":
+            # Для якорных ссылок (#order) добавляем полный URL
+            return f"{self.CATALOG_URL}{link}"
+        return f"{self.BASE_URL}{link}"
+
+    def _description_priority(self, container: Tag) -> int:
+        """
+        Приоритет блока описания карточки (меньше - важнее).
+
+        Args:
+            container: Элемент .product-card__description
+
+        Returns:
+            Индекс внешнего блока из DESCRIPTION_CONTAINERS или их количество
+        """
+        for priority, class_name in enumerate(self.DESCRIPTION_CONTAINERS):
+            if container.find_parent(class_=class_name):
+                return priority
+        return len(self.DESCRIPTION_CONTAINERS)
+
+    def _parse_card_element(self, card: Tag, title: str | None = None) -> dict[str, Any] | None:
+        """
+        Извлечь данные одной карточки из HTML.
+
+        Args:
+            card: Элемент .product-card
+            title: Уже известное название карты (если None, ищется в карточке)
+
+        Returns:
+            Словарь с данными о карте или None, если у карточки нет названия
+        """
+        if title is None:
+            heading = next(
+                filter(None, map(card.select_one, self.HEADING_SELECTORS)), None
+            )
+            title = heading.get_text().strip() if heading else ""
+        if not title:
+            return None
+
+        # Один обход карточки: элементы разбираются по группам по классам
+        descriptions: list[Tag] = []
+        factoids: list[Tag] = []
+        buttons: list[Tag] = []
+        for node in card.select(self.CARD_PARTS_SELECTOR):
+            classes = node.get("class") or []
+            if "factoid" in classes:
+                factoids.append(node)
+            elif "product-card__description" in classes:
+                descriptions.append(node)
+            else:
+                buttons.append(node)
+
+        description = None
+        for container in sorted(descriptions, key=self._description_priority):
+            paragraph = container.select_one("p")
+            description = (paragraph or container).get_text().strip()
+            if description:
+                break
+
+        # Особенности (factoids) без дубликатов по значению: один словарь
+        # служит и набором просмотренных значений, и списком в исходном порядке
+        features: dict[str, dict[str, str]] = {}
+        for factoid in factoids:
+            factoid_heading = factoid.select_one(self.FACTOID_HEADING_SELECTOR)
+            if not factoid_heading:
+                continue
+            value = factoid_heading.get_text().strip()
+            if not value or value in features:
+                continue
+            label = None
+            # Один обход factoid на подпись: tooltip приоритетнее описания
+            tooltip = None
+            factoid_desc = None
+            for node in factoid.select(self.FACTOID_LABEL_SELECTOR):
+                if node.find_parent(class_="factoid__tooltip"):
+                    tooltip = node
+                    break
+                if factoid_desc is None:
+                    factoid_desc = node
+            if tooltip:
+                label = tooltip.get_text().strip()
+            elif factoid_desc:
+                label = factoid_desc.get_text().strip()
+                # Убираем значение из описания, если оно там есть
+                if label and value in label:
+                    label = label.replace(value, "", 1).strip()
+            features[value] = {"value": value, "label": label or value}
+
+        # Ссылки: приоритет кнопке оформления, иначе ссылка "Подробнее"
+        apply_link = None
+        details_link = None
+        if buttons:
+            for btn in buttons:
+                # Атрибуты кнопки читаются один раз
+                attrs = btn.attrs
+                href = attrs.get("href")
+                # Основная кнопка оформления определяется по атрибуту, без
+                # чтения текста; перебор по порядку сохраняет приоритет кнопок
+                if attrs.get("data-test-id") == "Button-primary-md":
+                    apply_link = href
+                    break
+                btn_text = btn.get_text().strip()
+                if _APPLY_TEXT_RE.search(btn_text):
+                    apply_link = href
+                    break
+                if details_link:
+                    continue
+                # Сначала дешевая проверка классов, затем текст
+                btn_classes = attrs.get("class") or []
+                if (
+                    "product-card__link" in btn_classes
+                    or "dk-sbol-link" in btn_classes
+                    or _DETAILS_TEXT_RE.search(btn_text)
+                ):
+                    details_link = href
+            if not apply_link:
+                apply_link = buttons[0].get("href")
+
+        return {
+            "title": title,
+            "description": description,
+            "badge": None,
+            "features": list(features.values()) or None,
+            "apply_link": self._normalize_link(apply_link),
+            "details_link": self._normalize_link(details_link),
+        }
+
+    def _parse_cards_html(self, soup: BeautifulSoup | Tag) -> list[dict[str, Any]]:
+        """
+        Извлечь все карточки кредитных карт из HTML каталога.
+
+        Args:
+            soup: Разобранный HTML страницы или блока каталога
+
+        Returns:
+            Список словарей с данными о картах
+        """
+        wraps = soup.select(".product-card__wrap")
+        if not wraps:
+            # Оберток нет - берем карточки продуктов напрямую
+            wraps = [
+                card
+                for card in soup.select(".product-card")
+                if card.select_one(".product-card__heading")
+                or card.find_parent(class_=["product-catalog__product-cards", "product-catalog"])
+            ]
+
+        card_elements = (
+            wrap.select_one(".product-card")
+            or (wrap if "product-card" in (wrap.get("class") or []) else None)
+            for wrap in wraps
+        )
+        # Карточки без названия отбрасываются одним фильтром; дубликаты по
+        # названию убирает _extract_cards для обоих методов разом
+        return list(filter(None, map(self._parse_card_element, filter(None, card_elements))))
+
+    def _parse_cards_by_headings(self, soup: BeautifulSoup | Tag) -> list[dict[str, Any]]:
+        """
+        Запасной метод: найти заголовки карт и построить карточки вокруг них.
+
+        Args:
+            soup: Разобранный HTML страницы или блока каталога
+
+        Returns:
+            Список словарей с данными о картах
+        """
+        catalog = soup.select_one(".product-catalog__product-cards, .product-catalog")
+        container = catalog or soup
+
+        cards = []
+        # Карточка с несколькими заголовками разбирается один раз
+        seen_cards: set[int] = set()
+        for heading in container.select(
+            'h2.product-card__heading, .product-card__heading, h2[class*="heading"]'
+        ):
+            # Находим родительскую карточку, а если ее нет - контейнер карточки
+            card = heading.find_parent(class_="product-card") or heading.find_parent(
+                class_=["product-card__content", "product-card__wrap"]
+            )
+            if card is None or id(card) in seen_cards:
+                continue
+            seen_cards.add(id(card))
+
+            card_info = self._parse_card_element(card, title=heading.get_text().strip())
+            if card_info:
+                cards.append(card_info)
+        return cards
+
+    async def _fetch_static(
+        self, url: str, known_validator: str | None = None
+    ) -> tuple[dict[str, Any] | None, str | None]:
+        """
+        Быстрый путь: загрузить каталог обычным HTTP-запросом, без браузера.
+
+        Args:
+            url: URL страницы для парсинга
+            known_validator: Признак версии сохраненного результата; если
+                страница не изменилась, HTML повторно не разбирается
+
+        Returns:
+            Кортеж (результат в формате parse_page, признак версии). Результат
+            равен None, если карточек в ответе нет (страница рендерится
+            скриптами или открылась страница ошибки) или если страница не
+            изменилась с known_validator
+        """
+        try:
+            async with self._http_client() as client:
+                response = await client.get(url)
+                response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.info("Быстрая загрузка без браузера не удалась: %s", e)
+            return None, None
+
+        html = response.text
+        if "product-card" not in html or any(
+            marker in html for marker in self.CERT_ERROR_MARKERS
+        ):
+            return None, None
+
+        validator = self._header_validator(response.headers) or self._content_validator(
+            response.content
+        )
+        if validator == known_validator:
+            return None, validator
+
+        # Та же логика извлечения, что и для HTML из браузера (с запасным методом)
+        soup = BeautifulSoup(html, "lxml")
+        cards = self._extract_cards(soup)
+        if not cards:
+            return None, None
+
+        return {
+            "url": url,
+            "title": soup.title.get_text().strip() if soup.title else "",
+            "cards_count": len(cards),
+            "cards": cards,
+        }, validator
 
     async def parse_page(self, url: str) -> dict[str, Any]:
         """
         Парсинг страницы с кредитными картами Сбербанка.
 
+        Повторные вызовы в течение cache_ttl возвращают сохраненный результат;
+        после него результат переиспользуется, если страница не изменилась.
+        Сначала пробует загрузить каталог без браузера; Selenium используется,
+        только если в ответе нет разметки карточек.
+
         Args:
             url: URL страницы для парсинга
 
         Returns:
             Словарь с извлеченными данными о кредитных картах
         """
+        result = await self._parse_without_browser(url)
+        if result is not None:
+            return result
+
+        await self.start()
         driver = self.driver
 
         # Переход на страницу
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, driver.get, url)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, driver.get, url)
 
-        # Увеличиваем время ожидания для полной загрузки страницы
-        await self.random_delay(3.0, 4.0)
+        return await self._collect_current_page(driver, url)
 
-        # Обновляем driver на случай, если был создан новый при обработке ошибок
-        driver = self.driver
+    async def parse_pages(self, urls: list[str]) -> list[dict[str, Any]]:
+        """
+        Парсинг нескольких страниц каталога в одном браузере.
 
-        # Ожидание загрузки страницы и появления элементов
-        wait = WebDriverWait(driver, self.timeout)
+        Страницы, которые не удалось получить без браузера, открываются во
+        вкладках (не более MAX_TABS одновременно) и загружаются параллельно,
+        после чего данные собираются из каждой вкладки по очереди.
 
-        # Ждем появления хотя бы одного текстового виджета или контента
-        try:
-            # Явно ждем появления карточек через WebDriverWait - увеличиваем timeout
+        Args:
+            urls: URL страниц для парсинга
+
+        Returns:
+            Результаты в формате parse_page в порядке urls
+        """
+        results: dict[str, dict[str, Any]] = {}
+        pending = []
+        for url in dict.fromkeys(urls):
+            result = await self._parse_without_browser(url)
+            if result is not None:
+                results[url] = result
+            else:
+                pending.append(url)
+
+        if pending:
+            await self.start()
+            for start in range(0, len(pending), self.MAX_TABS):
+                results.update(await self._parse_in_tabs(pending[start : start + self.MAX_TABS]))
+
+        return [results[url] for url in urls]
+
+    def _open_tabs(self, driver: WebDriver, urls: list[str]) -> tuple[str, list[str]]:
+        """
+        Открыть страницы в новых вкладках, не дожидаясь их загрузки.
+
+        Returns:
+            Кортеж (исходная вкладка, вкладки в порядке urls)
+        """
+        original = driver.current_window_handle
+        handles = []
+        for url in urls:
+            driver.switch_to.new_window('tab')
+            if isinstance(driver, webdriver.Chrome):
+                self._prepare_chrome_tab(driver)
+            # location.assign не блокирует: страницы грузятся параллельно
+            driver.execute_script("window.location.assign(arguments[0]);", url)
+            handles.append(driver.current_window_handle)
+        return original, handles
+
+    def _wait_navigation(self, driver: WebDriver, handle: str) -> None:
+        """
+        Переключиться на вкладку и дождаться, пока в ней откроется страница.
+
+        Асинхронный скрипт, запущенный до перехода со страницы about:blank,
+        прервался бы при выгрузке документа.
+        """
+        driver.switch_to.window(handle)
+        WebDriverWait(driver, self.timeout).until(
+            lambda d: d.execute_script(
+                "return location.href !== 'about:blank' && document.readyState !== 'loading';"
+            )
+        )
+
+    @staticmethod
+    def _close_tab(driver: WebDriver, handle: str, original: str) -> None:
+        """Закрыть вкладку и вернуться в исходную."""
+        driver.switch_to.window(handle)
+        driver.close()
+        driver.switch_to.window(original)
+
+    async def _parse_in_tabs(self, urls: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        Загрузить страницы во вкладках одного браузера и собрать с них данные.
+
+        Args:
+            urls: URL страниц (не больше MAX_TABS)
+
+        Returns:
+            Словарь {url: результат в формате parse_page}
+        """
+        driver = self.driver
+        loop = asyncio.get_running_loop()
+        original, handles = await loop.run_in_executor(
+            self._executor, self._open_tabs, driver, urls
+        )
+        results = {}
+        for url, handle in zip(urls, handles):
             try:
                 await loop.run_in_executor(
-                    None,
-                    lambda: wait.until(
-                        EC.any_of(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, ".product-card__wrap")),
-                            EC.presence_of_element_located((By.CSS_SELECTOR, ".product-card")),
-                            EC.presence_of_element_located((By.CSS_SELECTOR, ".product-catalog__product-cards")),
-                            EC.presence_of_element_located((By.CSS_SELECTOR, ".product-catalog"))
-                        )
-                    )
+                    self._executor, self._wait_navigation, driver, handle
                 )
-                print("Элементы карточек найдены на странице (WebDriverWait)")
-            except Exception as wait_error:
-                print(f"Явное ожидание элементов не сработало: {wait_error}, продолжаем...")
-                # Дополнительное ожидание вручную
-                await self.random_delay(2.0, 3.0)
-
-            # Дополнительная проверка загрузки через JavaScript
-            page_ready = await loop.run_in_executor(
-                None,
-                driver.execute_script,
-                """
-                // Ждем загрузки DOM и появления элементов
-                const checkReady = () => {
-                    const cards = document.querySelectorAll('.product-card');
-                    const wraps = document.querySelectorAll('.product-card__wrap');
-                    const hasContent = document.body.textContent.includes('Карта') ||
-                                      document.body.textContent.includes('кредит') ||
-                                      document.body.textContent.includes('кредитная');
-                    return cards.length > 0 || wraps.length > 0 || hasContent;
-                };
-
-                // Ждем до 20 секунд с более частыми проверками
-                const startTime = Date.now();
-                const maxWait = 20000;
-                let lastCheckCount = 0;
-                while (Date.now() - startTime < maxWait) {
-                    const currentCards = document.querySelectorAll('.product-card');
-                    const currentWraps = document.querySelectorAll('.product-card__wrap');
-                    const currentCount = currentCards.length + currentWraps.length;
-
-                    // Если количество элементов увеличивается, продолжаем ждать
-                    if (currentCount > lastCheckCount) {
-                        lastCheckCount = currentCount;
-                        console.log(`Найдено элементов: ${currentCount}`);
-                    }
-
-                    if (document.readyState === 'complete' && checkReady()) {
-                        console.log(`Готово! Найдено элементов: ${currentCount}`);
-                        return true;
-                    }
-                    // Небольшая задержка между проверками
-                    const start = Date.now();
-                    while (Date.now() - start < 200) {}
-                }
-                const finalCheck = checkReady();
-                console.log(`Финальная проверка: ${finalCheck}, найдено элементов: ${lastCheckCount}`);
-                return finalCheck;
-                """
-            )
-            if page_ready:
-                print("Страница загружена, элементы найдены")
-            else:
-                print("Страница может быть не полностью загружена, продолжаем парсинг...")
-        except Exception as e:
-            print(f"Ошибка при проверке загрузки страницы: {e}, продолжаем парсинг...")
+                results[url] = await self._collect_current_page(driver, url)
+            finally:
+                await loop.run_in_executor(
+                    self._executor, self._close_tab, driver, handle, original
+                )
+        return results
+
+    async def _parse_without_browser(self, url: str) -> dict[str, Any] | None:
+        """
+        Получить результат из кэша или обычным HTTP-запросом.
 
-        # Проверяем, не появилась ли страница с ошибкой сертификата
+        Args:
+            url: URL страницы для парсинга
+
+        Returns:
+            Результат в формате parse_page или None, если нужен браузер
+        """
+        cached, cached_validator = await self._get_unchanged_page(url)
+        if cached is not None:
+            return cached
+
+        static_result, validator = await self._fetch_static(url, cached_validator)
+        if static_result is None and validator is not None and validator == cached_validator:
+            return self._renew_page(url)
+        if static_result is not None:
+            logger.info("Карты получены без браузера: %d", static_result["cards_count"])
+            self._store_page(url, static_result, validator)
+            return copy.deepcopy(static_result)
+        return None
+
+    async def _collect_current_page(self, driver: WebDriver, url: str) -> dict[str, Any]:
+        """
+        Собрать данные о картах с открытой в браузере страницы.
+
+        Args:
+            driver: WebDriver экземпляр (страница url уже открыта)
+            url: URL страницы
+
+        Returns:
+            Словарь с извлеченными данными о кредитных картах
+        """
+        loop = asyncio.get_running_loop()
+
+        # Ожидание карточек, прокрутка и извлечение данных - одной командой
+        page_data: dict[str, Any] = {}
         try:
-            # page_source - это свойство, а не метод
-            page_source = await loop.run_in_executor(None, lambda: driver.page_source)
-            if "Возникла проблема при открытии сайта Сбербанка" in page_source or \
-               "не установлены сертификаты Национального УЦ Минцифры" in page_source:
-                raise Exception(
-                    "Обнаружена страница с ошибкой сертификатов. "
-                    "Убедитесь, что сертификаты Минцифры установлены в браузере."
-                )
+            page_data = await loop.run_in_executor(
+                self._executor,
+                driver.execute_async_script,
+                _COLLECT_CARDS_JS,
+                list(self.CERT_ERROR_MARKERS),
+            ) or {}
+            if "error" in page_data:
+                logger.warning("Ошибка при сборе данных со страницы: %s", page_data["error"])
         except Exception as e:
-            # Если ошибка при проверке, пробуем продолжить
-            if "сертификатов" not in str(e).lower():
-                print(f"Предупреждение при проверке страницы: {e}")
-            pass
+            logger.warning("Ошибка при сборе данных со страницы: %s", e)
+
+        # Проверка текста страницы выполняется в браузере: весь DOM
+        # (page_source) через WebDriver не передается
+        if page_data.get("certError"):
+            logger.warning(
+                "Обнаружена страница с ошибкой сертификатов. "
+                "Убедитесь, что сертификаты Минцифры установлены в браузере."
+            )
 
-        # Прокрутка для загрузки lazy-loaded элементов (несколько раз)
-        try:
-            # Прокручиваем постепенно для загрузки всего контента
-            for scroll_step in [0.25, 0.5, 0.75, 1.0]:
-                await loop.run_in_executor(
-                    None,
-                    driver.execute_script,
-                    f"window.scrollTo(0, document.body.scrollHeight * {scroll_step});"
-                )
-                await self.random_delay(0.3, 0.5)
-
-            # Дополнительная задержка для полной загрузки динамического контента
-            await self.random_delay(1.5, 2.5)
-
-            # Финальная проверка после прокрутки - ждем появления элементов
-            elements_after_scroll = await loop.run_in_executor(
-                None,
-                driver.execute_script,
-                """
-                return {
-                    cardWraps: document.querySelectorAll('.product-card__wrap').length,
-                    productCards: document.querySelectorAll('.product-card').length,
-                    hasCatalog: !!document.querySelector('.product-catalog__product-cards, .product-catalog')
-                };
-                """
+        if page_data.get("ready"):
+            logger.debug("Страница загружена, элементы найдены")
+        else:
+            logger.info("Страница может быть не полностью загружена, продолжаем парсинг...")
+
+        counts = page_data.get("counts") or {}
+        logger.debug(
+            "Элементы после прокрутки%s: .product-card__wrap=%s, .product-card=%s, "
+            ".product-catalog__product-cards=%s, .product-card__heading=%s, есть каталог=%s",
+            " (после повторного ожидания)" if page_data.get("retried") else "",
+            counts.get("cardWraps", 0),
+            counts.get("productCards", 0),
+            counts.get("productCatalog", False),
+            counts.get("hasHeading", False),
+            counts.get("hasCatalog", False),
+        )
+        if counts.get("cardWraps", 0) == 0 and counts.get("productCards", 0) == 0:
+            logger.warning(
+                "Карточки не найдены! Начало текста страницы: %s",
+                counts.get("bodyText", "")[:200],
             )
-            print(f"Элементы после прокрутки:")
-            print(f"  .product-card__wrap: {elements_after_scroll.get('cardWraps', 0)}")
-            print(f"  .product-card: {elements_after_scroll.get('productCards', 0)}")
-            print(f"  Есть каталог: {elements_after_scroll.get('hasCatalog', False)}")
-
-            # Если элементы все еще не найдены, пробуем подождать еще
-            if elements_after_scroll.get('cardWraps', 0) == 0 and elements_after_scroll.get('productCards', 0) == 0:
-                print("Элементы все еще не найдены после прокрутки, жду еще...")
-                await self.random_delay(2.0, 3.0)
-                # Еще одна проверка
-                elements_final = await loop.run_in_executor(
-                    None,
-                    driver.execute_script,
-                    """
-                    return {
-                        cardWraps: document.querySelectorAll('.product-card__wrap').length,
-                        productCards: document.querySelectorAll('.product-card').length,
-                        hasCatalog: !!document.querySelector('.product-catalog__product-cards, .product-catalog')
-                    };
-                    """
-                )
-                print(f"Финальная проверка элементов:")
-                print(f"  .product-card__wrap: {elements_final.get('cardWraps', 0)}")
-                print(f"  .product-card: {elements_final.get('productCards', 0)}")
-                print(f"  Есть каталог: {elements_final.get('hasCatalog', False)}")
-        except Exception as e:
-            print(f"Ошибка при прокрутке страницы: {e}")
-            pass
 
-        # Извлечение данных о всех картах
-        cards = await self._extract_cards(driver)
+        # Карточки разбираются из HTML каталога на стороне Python
+        soup = BeautifulSoup(page_data.get("catalogHtml") or "", "lxml")
+        cards = self._extract_cards(soup, counts)
 
         # Отладочный вывод
-        print(f"Извлечено карт: {len(cards)}")
+        logger.info("Извлечено карт: %d", len(cards))
 
-        # Получаем title правильно (это свойство, а не метод)
-        title = await loop.run_in_executor(None, lambda: driver.title)
+        title = page_data.get("title")
+        if title is None:
+            # title - это свойство, а не метод
+            title = await loop.run_in_executor(self._executor, lambda: driver.title)
 
-        return {
+        result = {
             "url": url,
             "title": title,
             "cards_count": len(cards),
             "cards": cards,
         }
-
-    async def _extract_cards(self, driver: WebDriver) -> list[dict[str, Any]]:
+        # Пустой результат не сохраняем, чтобы следующий вызов повторил попытку
+        if cards:
+            self._store_page(url, result, await self._fetch_validator(url))
+            return copy.deepcopy(result)
+        return result
+
+    def _extract_cards(
+        self, soup: BeautifulSoup, counts: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
         """
-        Извлечение данных о всех кредитных картах.
+        Извлечение данных о всех кредитных картах из HTML каталога.
+
+        Браузер здесь уже не нужен: основной и запасной методы работают
+        с HTML, полученным из браузера одной командой, а отладочные
+        счетчики приходят в том же ответе.
 
         Args:
-            driver: WebDriver экземпляр
+            soup: Разобранный HTML каталога (или всей страницы)
+            counts: Счетчики элементов страницы из скрипта сбора данных
 
         Returns:
             Список словарей с данными о картах
         """
         cards = []
-        loop = asyncio.get_event_loop()
-
-        # Сначала проверяем, есть ли элементы на странице
-        try:
-            element_check = await loop.run_in_executor(
-                None,
-                driver.execute_script,
-                """
-                return {
-                    cardWraps: document.querySelectorAll('.product-card__wrap').length,
-                    productCards: document.querySelectorAll('.product-card').length,
-                    productCatalog: !!document.querySelector('.product-catalog__product-cards'),
-                    hasHeading: document.querySelectorAll('.product-card__heading').length > 0,
-                    bodyText: document.body.textContent.substring(0, 500)
-                };
-                """
-            )
-            print(f"Проверка элементов на странице:")
-            print(f"  .product-card__wrap: {element_check.get('cardWraps', 0)}")
-            print(f"  .product-card: {element_check.get('productCards', 0)}")
-            print(f"  .product-catalog__product-cards: {element_check.get('productCatalog', False)}")
-            print(f"  .product-card__heading: {element_check.get('hasHeading', False)}")
-            if element_check.get('cardWraps', 0) == 0 and element_check.get('productCards', 0) == 0:
-                print(f"Карточки не найдены! Первые 500 символов страницы: {element_check.get('bodyText', '')[:200]}")
-        except Exception as e:
-            print(f"Ошибка при проверке элементов: {e}")
 
-        # Извлекаем все карты из блока product-catalog__product-cards
-        # Используем тот же подход, что и в кредитных продуктах (который работает)
         try:
-            card_data_list = await loop.run_in_executor(
-                None,
-                driver.execute_script,
-                """
-                const cards = [];
-
-                // Ищем все карточки продуктов - используем простой подход, как в кредитных продуктах
-                // Сначала пробуем через .product-card__wrap
-                let cardWraps = Array.from(document.querySelectorAll('.product-card__wrap'));
-
-                console.log(`Найдено .product-card__wrap: ${cardWraps.length}`);
-
-                // Если нет оберток, пробуем найти карточки напрямую
-                if (cardWraps.length === 0) {
-                    console.log('Обертки не найдены, ищу карточки напрямую...');
-                    const directCards = document.querySelectorAll('.product-card');
-                    console.log(`Найдено .product-card напрямую: ${directCards.length}`);
-
-                    // Создаем массив оберток из прямых карточек
-                    const wrapsArray = [];
-                    for (const directCard of directCards) {
-                        // Проверяем, что это карточка продукта (не другая карточка)
-                        const hasHeading = directCard.querySelector('.product-card__heading');
-                        const inCatalog = directCard.closest('.product-catalog__product-cards') ||
-                                          directCard.closest('.product-catalog');
-
-                        if (hasHeading || inCatalog) {
-                            wrapsArray.push(directCard);
-                        }
-                    }
-                    console.log(`Отфильтровано карточек продуктов: ${wrapsArray.length}`);
-                    cardWraps = wrapsArray;
-                }
-
-                console.log(`Всего карточек для обработки: ${cardWraps.length}`);
-
-                for (let i = 0; i < cardWraps.length; i++) {
-                    try {
-                        const wrap = cardWraps[i];
-                        let card = wrap.querySelector('.product-card');
-                        // Если карточка не найдена внутри wrap, возможно сама wrap является карточкой
-                        if (!card && wrap.classList && wrap.classList.contains('product-card')) {
-                            card = wrap;
-                        }
-                        if (!card) {
-                            console.log(`Карточка не найдена для wrap ${i + 1}/${cardWraps.length}, пропускаем`);
-                            continue;
-                        }
-
-                        console.log(`Обрабатываем карточку ${i + 1}/${cardWraps.length}`);
-
-                        // Извлекаем название карты (может быть в двух местах: inner и outer, или просто в карточке)
-                        let title = null;
-                        const headingInner = card.querySelector('.product-card__content_inner .product-card__heading');
-                        const headingOuter = card.querySelector('.product-card__content_outer .product-card__heading');
-                        const headingAny = card.querySelector('.product-card__heading');
-
-                        if (headingInner) {
-                            title = (headingInner.textContent || '').trim();
-                        } else if (headingOuter) {
-                            title = (headingOuter.textContent || '').trim();
-                        } else if (headingAny) {
-                            title = (headingAny.textContent || '').trim();
-                        }
-
-                        if (!title || title.length === 0) continue;
-
-                        // Извлекаем описание (может быть в p или просто текст)
-                        let description = null;
-                        // Сначала пробуем найти в inner контейнере
-                        const descInnerContainer = card.querySelector('.product-card__content_inner .product-card__description');
-                        if (descInnerContainer) {
-                            const descInnerP = descInnerContainer.querySelector('p');
-                            description = descInnerP ? (descInnerP.textContent || '').trim() : (descInnerContainer.textContent || '').trim();
-                        }
-
-                        // Если не нашли в inner, пробуем outer
-                        if (!description) {
-                            const descOuterContainer = card.querySelector('.product-card__content_outer .product-card__description');
-                            if (descOuterContainer) {
-                                const descOuterP = descOuterContainer.querySelector('p');
-                                description = descOuterP ? (descOuterP.textContent || '').trim() : (descOuterContainer.textContent || '').trim();
-                            }
-                        }
-
-                        // Если все еще не нашли, ищем в любом месте карточки
-                        if (!description) {
-                            const descAny = card.querySelector('.product-card__description');
-                            if (descAny) {
-                                const descAnyP = descAny.querySelector('p');
-                                description = descAnyP ? (descAnyP.textContent || '').trim() : (descAny.textContent || '').trim();
-                            }
-                        }
-
-                        // Извлекаем особенности (factoids) - ищем во всех местах карточки
-                        const features = [];
-
-                        // Ищем factoids в обоих контейнерах (inner и outer)
-                        const factoidsContainers = card.querySelectorAll('.product-card__factoids');
-                        for (const factoidsContainer of factoidsContainers) {
-                            const factoids = factoidsContainer.querySelectorAll('.factoid');
-                            for (const factoid of factoids) {
-                                const factoidHeading = factoid.querySelector('h3.dk-sbol-heading');
-
-                                if (factoidHeading) {
-                                    const value = (factoidHeading.textContent || '').trim();
-                                    let label = null;
-
-                                    // Ищем описание в разных местах - используем тот же подход, что в кредитных продуктах
-                                    const factoidTooltip = factoid.querySelector('.factoid__tooltip .dk-sbol-text p, .factoid__tooltip .dk-sbol-text span, .factoid__tooltip .dk-sbol-text');
-                                    const factoidDesc = factoid.querySelector('.factoid__description .dk-sbol-text p, .factoid__description .dk-sbol-text span, .factoid__description .dk-sbol-text');
-
-                                    if (factoidTooltip) {
-                                        label = (factoidTooltip.textContent || '').trim();
-                                    } else if (factoidDesc) {
-                                        label = (factoidDesc.textContent || '').trim();
-                                        // Убираем значение из описания, если оно там есть
-                                        if (label && label.includes(value)) {
-                                            label = label.replace(value, '').trim();
-                                        }
-                                    }
-
-                                    if (value) {
-                                        features.push({
-                                            value: value,
-                                            label: label || value
-                                        });
-                                    }
-                                }
-                            }
-                        }
-
-                        // Убираем дубликаты особенностей по значению
-                        const uniqueFeatures = [];
-                        const seenValues = new Set();
-                        for (const feature of features) {
-                            if (!seenValues.has(feature.value)) {
-                                seenValues.add(feature.value);
-                                uniqueFeatures.push(feature);
-                            }
-                        }
-
-                        // Извлекаем ссылки - используем тот же подход, что в кредитных продуктах
-                        let applyLink = null;
-                        let detailsLink = null;
-
-                        const buttonsContainer = card.querySelector('.product-card__buttons');
-                        if (buttonsContainer) {
-                            // Ищем все ссылки в контейнере кнопок
-                            const allButtons = buttonsContainer.querySelectorAll('a');
-                            for (const btn of allButtons) {
-                                const btnText = (btn.textContent || '').trim();
-                                const testId = btn.getAttribute('data-test-id');
-                                const href = btn.getAttribute('href') || btn.href;
-
-                                // Приоритет кнопке оформления, но если её нет, берем ссылку подробнее
-                                if (testId === 'Button-primary-md' || btnText.includes('Оформить') ||
-                                    btnText.includes('Подать') || btnText.includes('Выбрать')) {
-                                    applyLink = href;
-                                    break;
-                                } else if (btnText.includes('Подробнее') || btnText.includes('Узнать') ||
-                                          btn.classList.contains('product-card__link') ||
-                                          btn.classList.contains('dk-sbol-link')) {
-                                    if (!detailsLink) {
-                                        detailsLink = href;
-                                    }
-                                }
-                            }
-
-                            // Если ссылка на оформление не найдена, берем первую доступную
-                            if (!applyLink && allButtons.length > 0) {
-                                applyLink = allButtons[0].getAttribute('href') || allButtons[0].href;
-                            }
-                        }
-
-                        // Оставляем ссылки как есть, нормализация будет в Python коде
-
-                        cards.push({
-                            title: title,
-                            description: description,
-                            features: uniqueFeatures.length > 0 ? uniqueFeatures : null,
-                            badge: null,
-                            apply_link: applyLink,
-                            details_link: detailsLink
-                        });
-                    } catch (e) {
-                        console.error('Ошибка при извлечении карты:', e);
-                        continue;
-                    }
-                }
-
-                return cards;
-                """
-            )
-
+            # Дешевая проверка по счетчикам из браузера: если на странице нет ни
+            # оберток, ни карточек, основной метод заведомо ничего не найдет
+            if counts and not counts.get("cardWraps") and not counts.get("productCards"):
+                card_data_list = []
+            else:
+                card_data_list = self._parse_cards_html(soup)
             # Проверяем, что получили данные
             if not card_data_list:
-                print("JavaScript вернул пустой список карт")
+                logger.debug("В HTML каталога не найдено карт")
                 card_data_list = []
 
-            print(f"JavaScript вернул {len(card_data_list)} элементов (до фильтрации по title)")
+            logger.debug(
+                "Из HTML каталога извлечено %d карт",
+                len(card_data_list),
+            )
 
-            # Выводим первые несколько элементов для отладки
-            if len(card_data_list) > 0:
-                print("Примеры данных из JavaScript (первые 3):")
+            # Выводим первые несколько элементов для отладки (только если
+            # отладочный вывод включен - иначе строки не формируются вовсе)
+            if card_data_list and logger.isEnabledFor(logging.DEBUG):
                 for i, card_dict in enumerate(card_data_list[:3], 1):
-                    print(f"  Элемент {i}:")
-                    print(f"    title: {card_dict.get('title', 'N/A')}")
-                    print(f"    description: {card_dict.get('description', 'N/A')[:50] if card_dict.get('description') else 'N/A'}")
-                    print(f"    features: {len(card_dict.get('features', [])) if card_dict.get('features') else 0}")
-
-            # Нормализуем ссылки
-            normalized_cards = []
-            for card_dict in card_data_list:
-                if card_dict and card_dict.get("title"):
-                    card_info = {
-                        "title": card_dict.get("title"),
-                        "description": card_dict.get("description"),
-                        "badge": card_dict.get("badge"),
-                        "features": card_dict.get("features"),
-                        "apply_link": card_dict.get("apply_link"),
-                        "details_link": card_dict.get("details_link")
-                    }
-                    # Нормализуем ссылки
-                    if card_info["apply_link"] and not card_info["apply_link"].startswith("http"):
-                        if not card_info["apply_link"].startswith("#"):
-                            card_info["apply_link"] = f"https://www.sberbank.ru{card_info['apply_link']}"
-                        else:
-                            # Для якорных ссылок (#order) добавляем полный URL
-                            card_info["apply_link"] = f"https://www.sberbank.ru/ru/person/bank_cards/credit_cards{card_info['apply_link']}"
-                    if card_info["details_link"] and not card_info["details_link"].startswith("http"):
-                        if not card_info["details_link"].startswith("#"):
-                            card_info["details_link"] = f"https://www.sberbank.ru{card_info['details_link']}"
-                        else:
-                            card_info["details_link"] = f"https://www.sberbank.ru/ru/person/bank_cards/credit_cards{card_info['details_link']}"
-                    normalized_cards.append(card_info)
-
-            cards.extend(normalized_cards)
-            print(f"Найдено кредитных карт (после фильтрации): {len(normalized_cards)}")
+                    description = card_dict.get("description")
+                    logger.debug(
+                        "Пример %d: title=%s, description=%s, features=%d",
+                        i,
+                        card_dict.get("title", "N/A"),
+                        description[:50] if description else "N/A",
+                        len(card_dict.get("features") or []),
+                    )
+
+            # Карточки без названия отброшены еще при разборе, ссылки нормализованы
+            cards.extend(card_data_list)
 
             # Если карты не найдены, пробуем альтернативный метод
-            if len(normalized_cards) == 0:
-                print("Основной метод не нашел карты, пробую альтернативный метод...")
+            if not card_data_list:
+                logger.info("Основной метод не нашел карты, пробую альтернативный метод...")
                 try:
                     # Альтернативный метод - ищем все заголовки и строим карты вокруг них
-                    alternative_cards_data = await loop.run_in_executor(
-                        None,
-                        driver.execute_script,
-                        """
-                        const cards = [];
-                        const catalog = document.querySelector('.product-catalog__product-cards, .product-catalog');
-
-                        if (!catalog) {
-                            console.log('Каталог не найден, ищем во всем документе');
-                        }
-
-                        const searchContainer = catalog || document.body;
-
-                        // Ищем все элементы с заголовками, которые могут быть картами
-                        const headings = searchContainer.querySelectorAll('h2.product-card__heading, .product-card__heading, h2[class*="heading"]');
-                        console.log(`Найдено заголовков: ${headings.length}`);
-
-                        for (const heading of headings) {
-                            // Находим родительскую карточку
-                            let card = heading.closest('.product-card');
-                            if (!card) {
-                                // Если нет .product-card, пробуем найти контейнер карточки по структуре
-                                let parent = heading.parentElement;
-                                let depth = 0;
-                                while (parent && depth < 5 && !parent.classList.contains('product-card')) {
-                                    if (parent.classList.contains('product-card__content') ||
-                                        parent.classList.contains('product-card__wrap')) {
-                                        card = parent.closest('.product-card') || parent;
-                                        break;
-                                    }
-                                    parent = parent.parentElement;
-                                    depth++;
-                                }
-                            }
-
-                            if (card) {
-                                const title = (heading.textContent || '').trim();
-                                if (title && title.length > 0) {
-                                    // Извлекаем описание
-                                    let description = null;
-                                    const descEl = card.querySelector('.product-card__description');
-                                    if (descEl) {
-                                        const descP = descEl.querySelector('p');
-                                        description = descP ? (descP.textContent || '').trim() : (descEl.textContent || '').trim();
-                                    }
-
-                                    // Извлекаем factoids
-                                    const features = [];
-                                    const factoidsContainers = card.querySelectorAll('.product-card__factoids');
-                                    for (const factoidsContainer of factoidsContainers) {
-                                        const factoids = factoidsContainer.querySelectorAll('.factoid');
-                                        for (const factoid of factoids) {
-                                            const factoidHeading = factoid.querySelector('h3.dk-sbol-heading');
-                                            if (factoidHeading) {
-                                                const value = (factoidHeading.textContent || '').trim();
-                                                let label = null;
-                                                const factoidTooltip = factoid.querySelector('.factoid__tooltip .dk-sbol-text p, .factoid__tooltip .dk-sbol-text span, .factoid__tooltip .dk-sbol-text');
-                                                const factoidDesc = factoid.querySelector('.factoid__description .dk-sbol-text p, .factoid__description .dk-sbol-text span, .factoid__description .dk-sbol-text');
-
-                                                if (factoidTooltip) {
-                                                    label = (factoidTooltip.textContent || '').trim();
-                                                } else if (factoidDesc) {
-                                                    label = (factoidDesc.textContent || '').trim();
-                                                    if (label && label.includes(value)) {
-                                                        label = label.replace(value, '').trim();
-                                                    }
-                                                }
-
-                                                if (value) {
-                                                    features.push({ value: value, label: label || value });
-                                                }
-                                            }
-                                        }
-                                    }
-
-                                    // Убираем дубликаты
-                                    const uniqueFeatures = [];
-                                    const seenValues = new Set();
-                                    for (const feature of features) {
-                                        if (!seenValues.has(feature.value)) {
-                                            seenValues.add(feature.value);
-                                            uniqueFeatures.push(feature);
-                                        }
-                                    }
-
-                                    // Извлекаем ссылки
-                                    let applyLink = null;
-                                    let detailsLink = null;
-                                    const buttonsContainer = card.querySelector('.product-card__buttons');
-                                    if (buttonsContainer) {
-                                        const allButtons = buttonsContainer.querySelectorAll('a');
-                                        for (const btn of allButtons) {
-                                            const btnText = (btn.textContent || '').trim();
-                                            const testId = btn.getAttribute('data-test-id');
-                                            const href = btn.getAttribute('href') || btn.href;
-
-                                            if (testId === 'Button-primary-md' || btnText.includes('Оформить') ||
-                                                btnText.includes('Подать') || btnText.includes('Выбрать')) {
-                                                applyLink = href;
-                                                break;
-                                            } else if (btnText.includes('Подробнее') || btnText.includes('Узнать') ||
-                                                      btn.classList.contains('product-card__link') ||
-                                                      btn.classList.contains('dk-sbol-link')) {
-                                                if (!detailsLink) {
-                                                    detailsLink = href;
-                                                }
-                                            }
-                                        }
-
-                                        if (!applyLink && allButtons.length > 0) {
-                                            applyLink = allButtons[0].getAttribute('href') || allButtons[0].href;
-                                        }
-                                    }
-
-                                    cards.push({
-                                        title: title,
-                                        description: description,
-                                        features: uniqueFeatures.length > 0 ? uniqueFeatures : null,
-                                        badge: null,
-                                        apply_link: applyLink,
-                                        details_link: detailsLink
-                                    });
-                                }
-                            }
-                        }
-
-                        return cards;
-                        """
-                    )
+                    alternative_cards_data = self._parse_cards_by_headings(soup)
 
                     if alternative_cards_data and len(alternative_cards_data) > 0:
-                        print(f"Альтернативный метод нашел {len(alternative_cards_data)} карт")
-                        # Нормализуем ссылки для альтернативных карт
-                        for card_dict in alternative_cards_data:
-                            if card_dict.get("apply_link") and not card_dict.get("apply_link", "").startswith("http"):
-                                if not card_dict["apply_link"].startswith("#"):
-                                    card_dict["apply_link"] = f"https://www.sberbank.ru{card_dict['apply_link']}"
-                                else:
-                                    card_dict["apply_link"] = f"https://www.sberbank.ru/ru/person/bank_cards/credit_cards{card_dict['apply_link']}"
-                            if card_dict.get("details_link") and not card_dict.get("details_link", "").startswith("http"):
-                                if not card_dict["details_link"].startswith("#"):
-                                    card_dict["details_link"] = f"https://www.sberbank.ru{card_dict['details_link']}"
-                                else:
-                                    card_dict["details_link"] = f"https://www.sberbank.ru/ru/person/bank_cards/credit_cards{card_dict['details_link']}"
-
-                        normalized_cards.extend(alternative_cards_data)
+                        logger.info("Альтернативный метод нашел %d карт", len(alternative_cards_data))
+                        # Ссылки уже нормализованы в _parse_card_element
                         cards.extend(alternative_cards_data)
                 except Exception as alt_e:
-                    print(f"Ошибка при альтернативном извлечении: {alt_e}")
-                    traceback.print_exc()
+                    logger.exception("Ошибка при альтернативном извлечении: %s", alt_e)
 
         except Exception as e:
-            print(f"Ошибка при извлечении карт: {e}")
-            traceback.print_exc()
-
-        # Если карты не найдены, добавляем отладочную информацию
-        if len(cards) == 0:
-            print("Карты не найдены. Попытка альтернативного извлечения данных...")
-            debug_info = await loop.run_in_executor(
-                None,
-                driver.execute_script,
-                """
-                const info = {
-                    totalCardWraps: document.querySelectorAll('.product-card__wrap').length,
-                    totalProductCards: document.querySelectorAll('.product-card').length,
-                    hasProductCatalog: !!document.querySelector('.product-catalog__product-cards'),
-                    sampleHeadings: []
-                };
-
-                // Берем первые 5 заголовков для отладки
-                const headings = document.querySelectorAll('.product-card__heading');
-                for (let i = 0; i < Math.min(5, headings.length); i++) {
-                    const text = (headings[i].textContent || '').trim();
-                    if (text) {
-                        info.sampleHeadings.push(text);
-                    }
-                }
-
-                return info;
-                """
+            logger.exception("Ошибка при извлечении карт: %s", e)
+
+        # Если карты не найдены, добавляем отладочную информацию (только при
+        # включенном отладочном выводе)
+        if len(cards) == 0 and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Карты не найдены. Оберток карточек (.product-card__wrap): %s, "
+                "карточек (.product-card): %s, есть блок product-catalog__product-cards: %s, "
+                "примеры заголовков: %s",
+                (counts or {}).get("cardWraps", 0),
+                (counts or {}).get("productCards", 0),
+                (counts or {}).get("productCatalog", False),
+                [
+                    text[:100]
+                    for heading in soup.select(".product-card__heading")[:5]
+                    if (text := heading.get_text().strip())
+                ],
             )
-            print(f"Отладочная информация:")
-            print(f"  Всего оберток карточек (.product-card__wrap): {debug_info.get('totalCardWraps', 0)}")
-            print(f"  Всего карточек (.product-card): {debug_info.get('totalProductCards', 0)}")
-            print(f"  Есть блок product-catalog__product-cards: {debug_info.get('hasProductCatalog', False)}")
-            print(f"  Примеры заголовков (первые 5):")
-            for i, heading in enumerate(debug_info.get('sampleHeadings', [])[:5], 1):
-                print(f"    {i}. {heading[:100]}{'...' if len(heading) > 100 else ''}")
-
-        # Убираем дубликаты по названию
-        unique_cards = []
-        seen_titles = set()
+
+        # Убираем дубликаты по названию (первая карта с названием остается,
+        # карты без названия сохраняются все) с сохранением исходного порядка
+        seen_titles: set[str] = set()
+        unique_cards: list[dict[str, Any]] = []
+        append = unique_cards.append
+        add = seen_titles.add
         for card in cards:
-            title = card.get("title", "")
-            if title and title not in seen_titles:
-                seen_titles.add(title)
-                unique_cards.append(card)
-            elif not title:
-                unique_cards.append(card)
+            title = card.get("title")
+            if not title:
+                append(card)
+            elif title not in seen_titles:
+                add(title)
+                append(card)
 
         return unique_cards
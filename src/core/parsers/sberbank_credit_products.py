@@ -35,26 +35,263 @@
 """
 
 import asyncio
-import os
+import copy
+import logging
 import random
-import shutil
-from pathlib import Path
+import re
 from typing import Any
-import traceback
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+import httpx
+from bs4 import BeautifulSoup, Tag
 from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.remote.webdriver import WebDriver
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
+
+from core.parsers.sberbank_selenium import (
+    DriverPoolKey,
+    PageCacheMixin,
+    browser_installed,
+    build_chrome_options,
+    chrome_driver_path,
+    driver_pool,
+    gecko_driver_path,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Классификация особенностей продукта (factoids) на сумму и срок:
+# ключевые слова подписи (label) и значения (value)
+_LABEL_PRICE_RE = re.compile("сумм|кредит")
+_LABEL_TERM_RE = re.compile("срок|рассмотрим|оформление|обучение")
+_LABEL_RATE_RE = re.compile("ставка|платёж")
+_VALUE_PRICE_RE = re.compile("₽|млн|тыс")
+_DIGIT_RE = re.compile("[0-9]")
+
+
+# Скрипт извлечения продуктов со страницы. Определяет функцию
+# window.__extractSberProducts: в Chrome он один раз регистрируется через CDP
+# и выполняется при загрузке каждой страницы, поэтому браузер разбирает его
+# заново не при каждом вызове, а парсер передает только короткий вызов функции.
+_EXTRACT_PRODUCTS_JS = """
+window.__extractSberProducts = function () {
+    const products = [];
+
+    // Первый элемент с классом внутри элемента (HTMLCollection без разбора селектора)
+    const firstByClass = (root, className) =>
+        root ? root.getElementsByClassName(className)[0] || null : null;
+    const textOf = (el) => (el.textContent || '').trim();
+
+    // Ищем все карточки продуктов в основном блоке
+    const cardWraps = document.getElementsByClassName('product-card__wrap');
+
+    for (const wrap of cardWraps) {
+        try {
+            const card = firstByClass(wrap, 'product-card');
+            if (!card) continue;
+            const contentInner = firstByClass(card, 'product-card__content_inner');
+            const contentOuter = firstByClass(card, 'product-card__content_outer');
+
+            // Извлекаем название продукта
+            const heading = firstByClass(contentInner, 'product-card__heading') ||
+                            firstByClass(contentOuter, 'product-card__heading') ||
+                            firstByClass(card, 'product-card__heading');
+            const title = heading ? textOf(heading) : null;
+
+            if (!title) continue;
+
+            // Извлекаем описание (subtitle) - может быть в p или просто текст:
+            // сначала в inner контейнере, затем в outer, затем в любом месте карточки
+            let subtitle = null;
+            for (const root of [contentInner, contentOuter, card]) {
+                const descContainer = firstByClass(root, 'product-card__description');
+                if (descContainer) {
+                    const descP = descContainer.getElementsByTagName('p')[0];
+                    subtitle = textOf(descP || descContainer);
+                    if (subtitle) break;
+                }
+            }
+
+            // Метки (labels, например "Без комиссий") не входят в схему
+            // CREDIT_PRODUCT_SCHEMA, поэтому не извлекаются и не передаются
+
+            // Извлекаем особенности (factoids) - они содержат цену и срок.
+            // Дубликаты по значению отбрасываются сразу, до поиска подписи
+            const uniqueFactoids = [];
+            const seenValues = new Set();
+            const factoidsContainers = card.getElementsByClassName('product-card__factoids');
+            for (const factoidsContainer of factoidsContainers) {
+                const factoidElements = factoidsContainer.getElementsByClassName('factoid');
+                for (const factoid of factoidElements) {
+                    const factoidHeading = factoid.querySelector('h3.dk-sbol-heading');
+                    if (!factoidHeading) continue;
+
+                    const value = (factoidHeading.textContent || '').trim();
+                    if (!value || seenValues.has(value)) continue;
+                    seenValues.add(value);
+
+                    let label = null;
+                    // Ищем описание в разных местах
+                    const factoidTooltip = factoid.querySelector('.factoid__tooltip .dk-sbol-text p, .factoid__tooltip .dk-sbol-text span, .factoid__tooltip .dk-sbol-text');
+                    if (factoidTooltip) {
+                        label = (factoidTooltip.textContent || '').trim();
+                    } else {
+                        const factoidDesc = factoid.querySelector('.factoid__description .dk-sbol-text p, .factoid__description .dk-sbol-text span, .factoid__description .dk-sbol-text');
+                        if (factoidDesc) {
+                            label = (factoidDesc.textContent || '').trim();
+                            // Убираем значение из описания, если оно там есть
+                            if (label && label.includes(value)) {
+                                label = label.replace(value, '').trim();
+                            }
+                        }
+                    }
+
+                    uniqueFactoids.push({
+                        value: value,
+                        label: label || value
+                    });
+                }
+            }
+
+            // Извлекаем ссылки
+            let link = null;
+            const buttonsContainer = firstByClass(card, 'product-card__buttons');
+            if (buttonsContainer) {
+                // Ищем кнопку "Оформить онлайн", "Подать заявку" или ссылку "Подробнее"/"Узнать больше"
+                const allButtons = buttonsContainer.getElementsByTagName('a');
+                for (const btn of allButtons) {
+                    const btnText = (btn.textContent || '').trim();
+                    const testId = btn.getAttribute('data-test-id');
+                    const href = btn.getAttribute('href') || btn.href;
+
+                    // Приоритет кнопке оформления, но если её нет, берем ссылку подробнее
+                    if (testId === 'Button-primary-md' || btnText.includes('Оформить') ||
+                        btnText.includes('Подать') || btnText.includes('Выбрать')) {
+                        link = href;
+                        break;
+                    } else if (btnText.includes('Подробнее') || btnText.includes('Узнать')) {
+                        if (!link) {
+                            link = href;
+                        }
+                    }
+                }
+
+                // Если ссылка не найдена, берем первую доступную
+                if (!link && allButtons.length > 0) {
+                    link = allButtons[0].getAttribute('href') || allButtons[0].href;
+                }
+            }
+
+            products.push({
+                title: title,
+                subtitle: subtitle,
+                // price и term формируются из factoids на стороне Python
+                factoids: uniqueFactoids,
+                link: link
+            });
+        } catch (e) {
+            console.error('Ошибка при извлечении продукта:', e);
+            continue;
+        }
+    }
+
+    // Также извлекаем продукты из блока "Другие предложения" (other-card), если нужно
+    // (пока пропускаем, так как структура данных может отличаться)
+
+    return products;
+};
+"""
+# Вызов уже зарегистрированной функции (null, если ее на странице нет)
+_CALL_EXTRACT_PRODUCTS_JS = (
+    "return typeof window.__extractSberProducts === 'function' "
+    "? window.__extractSberProducts() : null;"
+)
+# Регистрация функции и вызов одной командой (Firefox и запасной вариант)
+_INSTALL_AND_EXTRACT_PRODUCTS_JS = (
+    _EXTRACT_PRODUCTS_JS + "return window.__extractSberProducts();"
+)
+
+
+# Единый скрипт обработки страницы: ожидание карточек, прокрутка для
+# lazy-loaded элементов, проверка ошибки сертификатов и извлечение продуктов.
+# Выполняется одной асинхронной командой WebDriver вместо отдельных запросов
+# на каждый шаг. Аргументы: признаки страницы ошибки сертификатов и таймаут
+# ожидания карточек (мс).
+_SCRAPE_PRODUCTS_JS = """
+const certErrorMarkers = arguments[0];
+const readyTimeout = arguments[1];
+const done = arguments[arguments.length - 1];
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+const countCards = () => document.querySelectorAll('.product-card__wrap').length;
+
+// Ждем выполнения условия, проверяя его только при изменениях DOM
+const waitFor = (predicate, timeout) => new Promise((resolve) => {
+    if (predicate()) {
+        resolve(true);
+        return;
+    }
+    let finished = false;
+    let timer = null;
+    const observer = new MutationObserver(() => onChange());
+    const finish = (result) => {
+        if (finished) return;
+        finished = true;
+        observer.disconnect();
+        clearTimeout(timer);
+        resolve(result);
+    };
+    const onChange = () => {
+        if (predicate()) finish(true);
+    };
+    observer.observe(document.documentElement, {childList: true, subtree: true});
+    timer = setTimeout(() => finish(predicate()), timeout);
+});
+
+const hasCertError = () => {
+    const pageText = document.body ? document.body.textContent : '';
+    return certErrorMarkers.some((marker) => pageText.includes(marker));
+};
+
+const scrape = async () => {
+    // Страница ошибки сертификатов приходит сразу целиком (driver.get
+    // возвращается после DOMContentLoaded) - карточек на ней не будет,
+    // поэтому не ждем их до таймаута
+    if (hasCertError()) {
+        return {ready: false, certError: true, products: [], title: document.title};
+    }
+
+    const ready = await waitFor(() => countCards() > 0, readyTimeout);
+
+    // Одна прокрутка в конец страницы, затем ждем, пока число карточек
+    // перестанет меняться (не дольше 3 секунд)
+    window.scrollTo(0, document.body.scrollHeight);
+    const scrollStarted = Date.now();
+    let lastCount = -1;
+    while (Date.now() - scrollStarted < 3000) {
+        await sleep(200);
+        const count = countCards();
+        if (count === lastCount) break;
+        lastCount = count;
+    }
+
+    if (!ready && hasCertError()) {
+        return {ready, certError: true, products: [], title: document.title};
+    }
+
+    const products = typeof window.__extractSberProducts === 'function'
+        ? window.__extractSberProducts()
+        : null;
+    return {ready, certError: false, products, title: document.title};
+};
+
+scrape().then(done, (e) => done({error: String(e)}));
+"""
 
 
-class SberbankCreditProductsSeleniumParser:
+class SberbankCreditProductsSeleniumParser(PageCacheMixin):
     """
     Парсер кредитных продуктов Сбербанка на основе Selenium.
 
@@ -71,6 +308,40 @@ class SberbankCreditProductsSeleniumParser:
     DEFAULT_TIMEOUT = 30.0
     DEFAULT_VIEWPORT_WIDTH = 1920
     DEFAULT_VIEWPORT_HEIGHT = 1080
+    # Минимум потоков для блокирующих вызовов Selenium (parse_pages
+    # увеличивает пул до max_concurrency)
+    EXECUTOR_WORKERS = 4
+    # Запас времени сверх timeout для асинхронного скрипта обработки страницы (секунды)
+    SCRIPT_TIMEOUT_MARGIN = 15.0
+    CHROME_USER_AGENT = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+    )
+    # Признаки страницы с ошибкой сертификатов Минцифры
+    CERT_ERROR_MARKERS = (
+        "Возникла проблема при открытии сайта Сбербанка",
+        "не установлены сертификаты Национального УЦ Минцифры",
+    )
+    # Ресурсы, не нужные для разбора карточек (блокируются в Chrome через CDP)
+    BLOCKED_URL_PATTERNS = (
+        "*.png",
+        "*.jpg",
+        "*.jpeg",
+        "*.webp",
+        "*.gif",
+        "*.svg",
+        "*.woff*",
+        "*.ttf",
+        "*.mp4",
+        "*google-analytics*",
+        "*googletagmanager*",
+        "*yandex.ru/metrika*",
+        "*mc.yandex*",
+        "*doubleclick*",
+    )
+    BASE_URL = "https://www.sberbank.ru"
+    # Браузеры переиспользуются между экземплярами парсера
+    _pool = driver_pool
 
     def __init__(
         self,
@@ -79,6 +350,7 @@ class SberbankCreditProductsSeleniumParser:
         viewport_width: int = DEFAULT_VIEWPORT_WIDTH,
         viewport_height: int = DEFAULT_VIEWPORT_HEIGHT,
         timeout: float = DEFAULT_TIMEOUT,
+        cache_ttl: float = PageCacheMixin.CACHE_TTL,
     ):
         """
         Инициализация парсера на основе Selenium.
@@ -89,13 +361,18 @@ class SberbankCreditProductsSeleniumParser:
             viewport_width: Ширина окна браузера
             viewport_height: Высота окна браузера
             timeout: Таймаут для операций в секундах
+            cache_ttl: Время (секунды), в течение которого результат страницы
+                возвращается без проверки изменений
         """
         self.headless = headless
         self.chrome_profile_path = chrome_profile_path  # Оставлено для совместимости
         self.viewport_width = viewport_width
         self.viewport_height = viewport_height
         self.timeout = timeout
+        self.cache_ttl = cache_ttl
         self._driver: WebDriver | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_workers = 0
 
     def _check_browser_installed(self, browser_name: str) -> bool:
         """
@@ -107,37 +384,7 @@ class SberbankCreditProductsSeleniumParser:
         Returns:
             True, если браузер установлен, False в противном случае
         """
-        if browser_name.lower() == 'chrome':
-            chrome_path = shutil.which('chrome') or shutil.which('google-chrome') or shutil.which('chromium')
-            if chrome_path:
-                return True
-
-            if os.name == 'nt':
-                chrome_paths = [
-                    Path("C:/Program Files/Google/Chrome/Application/chrome.exe"),
-                    Path("C:/Program Files (x86)/Google/Chrome/Application/chrome.exe"),
-                    Path.home() / "AppData/Local/Google/Chrome/Application/chrome.exe",
-                ]
-                for path in chrome_paths:
-                    if path.exists():
-                        return True
-
-        elif browser_name.lower() == 'firefox':
-            firefox_path = shutil.which('firefox') or shutil.which('mozilla-firefox')
-            if firefox_path:
-                return True
-
-            if os.name == 'nt':
-                firefox_paths = [
-                    Path("C:/Program Files/Mozilla Firefox/firefox.exe"),
-                    Path("C:/Program Files (x86)/Mozilla Firefox/firefox.exe"),
-                    Path.home() / "AppData/Local/Mozilla Firefox/firefox.exe",
-                ]
-                for path in firefox_paths:
-                    if path.exists():
-                        return True
-
-        return False
+        return browser_installed(browser_name.lower())
 
     def _get_available_browser(self) -> str | None:
         """
@@ -152,22 +399,6 @@ class SberbankCreditProductsSeleniumParser:
             return 'firefox'
         return None
 
-    def _get_firefox_profile_path(self) -> str | None:
-        """
-        Получить путь к профилю Firefox пользователя.
-
-        Returns:
-            Путь к профилю Firefox или None, если не найден
-        """
-        if os.name == 'nt':  # Windows
-            firefox_profiles = Path.home() / "AppData" / "Roaming" / "Mozilla" / "Firefox" / "Profiles"
-            if firefox_profiles.exists():
-                for profile_dir in firefox_profiles.iterdir():
-                    if profile_dir.is_dir() and (profile_dir.name.endswith('.default') or
-                                                  profile_dir.name.endswith('.default-release')):
-                        return str(profile_dir)
-        return None
-
     def _create_chrome_driver(self) -> WebDriver:
         """
         Создать драйвер Chrome, используя системные сертификаты Windows.
@@ -175,34 +406,33 @@ class SberbankCreditProductsSeleniumParser:
         Returns:
             Экземпляр WebDriver для Chrome
         """
-        chrome_options = ChromeOptions()
-
-        if self.headless:
-            chrome_options.add_argument("--headless=new")
-
-        chrome_options.add_argument(f"--window-size={self.viewport_width},{self.viewport_height}")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-setuid-sandbox")
-        chrome_options.add_argument("--lang=ru-RU")
-        chrome_options.add_argument("--start-maximized")
-
-        chrome_options.add_argument(
-            "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+        # Общие для парсеров Сбербанка настройки, включая стратегию загрузки
+        # eager: управление возвращается после DOMContentLoaded, появление
+        # карточек проверяет WebDriverWait
+        chrome_options = build_chrome_options(
+            self.headless, self.viewport_width, self.viewport_height, self.CHROME_USER_AGENT
         )
 
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_argument("--allow-running-insecure-content")
-        chrome_options.add_argument("--ignore-certificate-errors")
-
-        print("Используется Chrome с системными сертификатами Windows и игнорированием ошибок сертификата")
+        logger.info("Используется Chrome с системными сертификатами Windows и игнорированием ошибок сертификата")
 
         try:
-            service = ChromeService(ChromeDriverManager().install())
+            service = ChromeService(chrome_driver_path())
             driver = webdriver.Chrome(service=service, options=chrome_options)
+            driver.set_page_load_timeout(self.timeout)
+            # Скрипт обработки страницы ждет карточки до self.timeout и еще
+            # несколько секунд прокручивает страницу
+            driver.set_script_timeout(self.timeout + self.SCRIPT_TIMEOUT_MARGIN)
+
+            # Блокируем загрузку изображений, шрифтов, видео и аналитики
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {
+                'urls': list(self.BLOCKED_URL_PATTERNS)
+            })
+
+            # Функция извлечения продуктов компилируется один раз на страницу
+            driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+                'source': _EXTRACT_PRODUCTS_JS
+            })
 
             driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
                 'source': '''
@@ -217,7 +447,7 @@ class SberbankCreditProductsSeleniumParser:
 
             return driver
         except Exception as e:
-            print(f"\nОшибка при создании драйвера Chrome: {e}\n")
+            logger.error("Ошибка при создании драйвера Chrome: %s", e)
             raise
 
     def _create_firefox_driver(self) -> WebDriver:
@@ -228,6 +458,7 @@ class SberbankCreditProductsSeleniumParser:
             Экземпляр WebDriver для Firefox
         """
         firefox_options = FirefoxOptions()
+        firefox_options.page_load_strategy = "eager"
 
         if self.headless:
             firefox_options.add_argument("--headless")
@@ -242,12 +473,19 @@ class SberbankCreditProductsSeleniumParser:
         firefox_options.set_preference("security.tls.insecure_fallback_hosts", "sberbank.ru,www.sberbank.ru")
         firefox_options.set_preference("security.tls.unrestricted_rc4_fallback", True)
         firefox_options.set_preference("security.enterprise_roots.enabled", True)
+        # Без изображений и автовоспроизведения медиа
+        firefox_options.set_preference("permissions.default.image", 2)
+        firefox_options.set_preference("media.autoplay.default", 5)
 
-        print("Используется Firefox с системными сертификатами Windows")
+        logger.info("Используется Firefox с системными сертификатами Windows")
 
         try:
-            service = FirefoxService(GeckoDriverManager().install())
+            service = FirefoxService(gecko_driver_path())
             driver = webdriver.Firefox(service=service, options=firefox_options)
+            driver.set_page_load_timeout(self.timeout)
+            # Скрипт обработки страницы ждет карточки до self.timeout и еще
+            # несколько секунд прокручивает страницу
+            driver.set_script_timeout(self.timeout + self.SCRIPT_TIMEOUT_MARGIN)
             driver.set_window_size(self.viewport_width, self.viewport_height)
 
             driver.execute_script("""
@@ -261,7 +499,7 @@ class SberbankCreditProductsSeleniumParser:
 
             return driver
         except Exception as e:
-            print(f"\nОшибка при создании драйвера Firefox: {e}\n")
+            logger.error("Ошибка при создании драйвера Firefox: %s", e)
             raise
 
     def _create_driver(self) -> WebDriver:
@@ -283,13 +521,16 @@ class SberbankCreditProductsSeleniumParser:
             try:
                 return self._create_chrome_driver()
             except Exception as chrome_error:
-                print(f"\nНе удалось создать драйвер Chrome: {chrome_error}")
-                print("Пробую использовать Firefox в качестве запасного варианта...")
+                logger.warning(
+                    "Не удалось создать драйвер Chrome: %s. "
+                    "Пробую использовать Firefox в качестве запасного варианта...",
+                    chrome_error,
+                )
                 if self._check_browser_installed('firefox'):
                     try:
                         return self._create_firefox_driver()
                     except Exception as firefox_error:
-                        print(f"\nНе удалось создать драйвер Firefox: {firefox_error}")
+                        logger.error("Не удалось создать драйвер Firefox: %s", firefox_error)
                         raise RuntimeError(
                             f"Не удалось создать драйвер ни для Chrome, ни для Firefox.\n"
                             f"Ошибки: Chrome - {chrome_error}, Firefox - {firefox_error}"
@@ -311,23 +552,39 @@ class SberbankCreditProductsSeleniumParser:
 
         raise RuntimeError(f"Неподдерживаемый браузер: {browser}")
 
+    @property
+    def _pool_key(self) -> DriverPoolKey:
+        """Ключ пула драйверов для настроек этого парсера."""
+        return (type(self).__name__, self.headless, self.viewport_width, self.viewport_height)
+
+    @classmethod
+    def shutdown_pool(cls) -> None:
+        """Завершить все свободные браузеры общего пула (при выходе - автоматически)."""
+        cls._pool.shutdown()
+
     async def start(self) -> None:
-        """Инициализировать браузер."""
+        """Инициализировать браузер (свободный из пула или новый)."""
         if self._driver is None:
-            # Selenium не поддерживает async напрямую, поэтому используем executor
-            loop = asyncio.get_event_loop()
-            self._driver = await loop.run_in_executor(None, self._create_driver)
-            print("Парсер кредитных продуктов Сбербанка инициализирован")
+            # Selenium не поддерживает async напрямую, поэтому пул создает
+            # драйвер в executor
+            self._driver = await self._pool.acquire(
+                self._pool_key, self._create_driver, self._get_executor()
+            )
+            logger.info("Парсер кредитных продуктов Сбербанка инициализирован")
 
     async def close(self) -> None:
-        """Закрыть браузер и освободить ресурсы."""
+        """Вернуть браузер в пул для повторного использования."""
         if self._driver:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self._driver.quit)
+            await self._pool.release(self._pool_key, self._driver, self._executor)
             self._driver = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+            self._executor_workers = 0
 
     async def __aenter__(self):
-        await self.start()
+        # Браузер запускается лениво - только если страницу не удалось
+        # разобрать обычным HTTP-запросом
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -340,426 +597,467 @@ class SberbankCreditProductsSeleniumParser:
             raise RuntimeError("Driver not initialized. Call start() first.")
         return self._driver
 
+    def _get_executor(self, min_workers: int = 0) -> ThreadPoolExecutor:
+        """
+        Получить пул потоков парсера (создается при первом обращении).
+
+        Собственный пул потоков: вызовы драйвера не ждут в очереди общего
+        executor за посторонними задачами приложения.
+
+        Args:
+            min_workers: Сколько потоков нужно вызывающему (не меньше
+                EXECUTOR_WORKERS); меньший пул заменяется новым
+
+        Returns:
+            Пул потоков для блокирующих вызовов Selenium
+        """
+        workers = max(self.EXECUTOR_WORKERS, min_workers)
+        if self._executor is None or self._executor_workers < workers:
+            if self._executor is not None:
+                # Уже поставленные в очередь вызовы старый пул выполнит до конца
+                self._executor.shutdown(wait=False)
+            self._executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="sber-selenium"
+            )
+            self._executor_workers = workers
+        return self._executor
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Выполнить блокирующий вызов Selenium в пуле потоков парсера."""
+        return await asyncio.get_running_loop().run_in_executor(self._get_executor(), func, *args)
+
     async def random_delay(self, min_delay: float = 0.5, max_delay: float = 2.0) -> None:
         """Случайная задержка для имитации человеческого поведения."""
         await asyncio.sleep(random.uniform(min_delay, max_delay))
 
-    async def parse_page(self, url: str) -> dict[str, Any]:
+    async def _fetch_static(
+        self, url: str, known_validator: str | None = None
+    ) -> tuple[dict[str, Any] | None, str | None]:
         """
-        Парсинг страницы с кредитными продуктами Сбербанка.
+        Быстрый путь: загрузить страницу обычным HTTP-запросом, без браузера.
 
         Args:
-            url: URL страницы для парсинга (кредиты или ипотеки)
+            url: URL страницы для парсинга
+            known_validator: Признак версии сохраненного результата; если
+                страница не изменилась, HTML повторно не разбирается
 
         Returns:
-            Словарь с извлеченными данными о кредитных продуктах
+            Кортеж (результат в формате parse_page, признак версии). Результат
+            равен None, если карточек в ответе нет (страница рендерится
+            скриптами или открылась страница ошибки) или если страница не
+            изменилась с known_validator
         """
-        driver = self.driver
+        try:
+            async with self._http_client() as client:
+                response = await client.get(url)
+                response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.info("Быстрая загрузка без браузера не удалась: %s", e)
+            return None, None
+
+        html = response.text
+        if "product-card__wrap" not in html or any(
+            marker in html for marker in self.CERT_ERROR_MARKERS
+        ):
+            return None, None
+
+        validator = self._header_validator(response.headers) or self._content_validator(
+            response.content
+        )
+        if validator == known_validator:
+            return None, validator
 
-        # Переход на страницу
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, driver.get, url)
+        soup = BeautifulSoup(html, "lxml")
+        products = self._parse_products_html(soup, url)
+        if not products:
+            return None, None
 
-        # Увеличиваем время ожидания для полной загрузки страницы
-        await self.random_delay(2.0, 3.0)
+        return {
+            "url": url,
+            "title": soup.title.get_text().strip() if soup.title else "",
+            "products_count": len(products),
+            "products": products,
+        }, validator
 
-        driver = self.driver
+    async def _parse_without_browser(self, url: str) -> dict[str, Any] | None:
+        """
+        Получить результат из кэша или обычным HTTP-запросом.
 
-        # Ожидание загрузки страницы и появления элементов
-        wait = WebDriverWait(driver, self.timeout)
+        Args:
+            url: URL страницы для парсинга
 
-        # Ждем появления хотя бы одного продукта
-        try:
-            # Проверяем загрузку через JavaScript
-            page_ready = await loop.run_in_executor(
-                None,
-                driver.execute_script,
-                """
-                // Ждем загрузки DOM и появления элементов
-                const checkReady = () => {
-                    const cards = document.querySelectorAll('.product-card');
-                    const hasContent = document.body.textContent.includes('Кредит') ||
-                                      document.body.textContent.includes('ипотек') ||
-                                      document.body.textContent.includes('Ипотека');
-                    return cards.length > 0 || hasContent;
-                };
+        Returns:
+            Результат в формате parse_page или None, если нужен браузер
+        """
+        cached, cached_validator = await self._get_unchanged_page(url)
+        if cached is not None:
+            return cached
+
+        # Быстрый путь: серверный HTML уже содержит карточки продуктов
+        static_result, validator = await self._fetch_static(url, cached_validator)
+        if static_result is None and validator is not None and validator == cached_validator:
+            return self._renew_page(url)
+        if static_result is not None:
+            logger.info("Продукты получены без браузера: %d", static_result["products_count"])
+            self._store_page(url, static_result, validator)
+            return copy.deepcopy(static_result)
+        return None
 
-                // Ждем до 10 секунд
-                const startTime = Date.now();
-                const maxWait = 10000;
-                while (Date.now() - startTime < maxWait) {
-                    if (document.readyState === 'complete' && checkReady()) {
-                        return true;
-                    }
-                    // Небольшая задержка
-                    const start = Date.now();
-                    while (Date.now() - start < 100) {}
-                }
-                return checkReady();
-                """
-            )
-            if page_ready:
-                print("Страница загружена, элементы найдены")
-            else:
-                print("Страница может быть не полностью загружена, продолжаем парсинг...")
-        except Exception as e:
-            print(f"Ошибка при проверке загрузки страницы: {e}, продолжаем парсинг...")
+    def _normalize_link(self, link: str | None, url: str) -> str | None:
+        """
+        Привести ссылку продукта к абсолютному URL.
 
-        # Проверяем, не появилась ли страница с ошибкой сертификата
-        try:
-            page_source = await loop.run_in_executor(None, lambda: driver.page_source)
-            if "Возникла проблема при открытии сайта Сбербанка" in page_source or \
-               "не установлены сертификаты Национального УЦ Минцифры" in page_source:
-                raise Exception(
-                    "Обнаружена страница с ошибкой сертификатов. "
-                    "Убедитесь, что сертификаты Минцифры установлены в Firefox."
-                )
-        except Exception as e:
-            if "сертификатов" not in str(e).lower():
-                print(f"Предупреждение при проверке страницы: {e}")
-            pass
+        Args:
+            link: Ссылка из атрибута href (может быть относительной или якорной)
+            url: URL страницы, на которой найдена ссылка
 
-        # Прокрутка для загрузки lazy-loaded элементов (несколько раз)
-        try:
-            for scroll_step in [0.25, 0.5, 0.75, 1.0]:
-                await loop.run_in_executor(
-                    None,
-                    driver.execute_script,
-                    f"window.scrollTo(0, document.body.scrollHeight * {scroll_step});"
-                )
-                await self.random_delay(0.3, 0.5)
-        except Exception:
-            pass
+        Returns:
+            Абсолютная ссылка или None
+        """
+        if not link or link.startswith("http"):
+            return link
+        if link.startswith("//"):
+            return f"https:{link}"
+        if not link.startswith("#"):
+            return f"{self.BASE_URL}{link}"
+        # Для якорных ссылок добавляем полный URL на основе исходного URL
+        if '/credits/money' in url:
+            return f"{self.BASE_URL}/ru/person/credits/money{link}"
+        if '/credits/homenew' in url or '/credits/home' in url:
+            return f"{self.BASE_URL}/ru/person/credits/homenew{link}"
+        return f"{self.BASE_URL}{link}"
+
+    @staticmethod
+    def _classify_factoids(factoids: list[dict[str, str]]) -> tuple[str | None, str | None]:
+        """
+        Разделить особенности продукта на сумму (price) и срок (term).
 
-        # Извлечение данных о всех продуктах
-        products = await self._extract_products(driver, url)
+        Args:
+            factoids: Особенности продукта без дубликатов ({"value", "label"})
+
+        Returns:
+            Кортеж (price, term); части объединяются через запятую
+        """
+        price_parts = []
+        term_parts = []
+        for factoid in factoids:
+            value = factoid["value"]
+            label = factoid.get("label") or ""
+
+            # Приоритет label, так как он более точно описывает содержимое;
+            # если по label не определили, проверяем по value
+            if _LABEL_PRICE_RE.search(label) or ("взнос" in label and "%" in value):
+                price_parts.append(value)
+            elif _LABEL_TERM_RE.search(label) or (
+                _LABEL_RATE_RE.search(label) and "₽" not in value
+            ):
+                term_parts.append(value)
+            elif _VALUE_PRICE_RE.search(value) or ("от" in value and _DIGIT_RE.search(value)):
+                price_parts.append(value)
+            else:
+                # Сроки, ставки и прочие условия; по умолчанию тоже term
+                term_parts.append(value)
 
-        # Отладочный вывод
-        print(f"Извлечено продуктов: {len(products)}")
+        price = ", ".join(price_parts) if price_parts else None
+        term = ", ".join(term_parts) if term_parts else None
+        return price, term
 
-        # Получаем title правильно (это свойство, а не метод)
-        title = await loop.run_in_executor(None, lambda: driver.title)
+    def _parse_product_element(self, card: Tag, url: str) -> dict[str, Any] | None:
+        """
+        Извлечь данные одного продукта из HTML (тот же разбор, что и в браузере).
+
+        Args:
+            card: Элемент .product-card
+            url: URL страницы (для нормализации якорных ссылок)
+
+        Returns:
+            Словарь с данными о продукте или None, если у карточки нет названия
+        """
+        heading = (
+            card.select_one(".product-card__content_inner .product-card__heading")
+            or card.select_one(".product-card__content_outer .product-card__heading")
+            or card.select_one(".product-card__heading")
+        )
+        title = heading.get_text().strip() if heading else ""
+        if not title:
+            return None
+
+        subtitle = None
+        for selector in (
+            ".product-card__content_inner .product-card__description",
+            ".product-card__content_outer .product-card__description",
+            ".product-card__description",
+        ):
+            container = card.select_one(selector)
+            if container:
+                paragraph = container.select_one("p")
+                subtitle = (paragraph or container).get_text().strip()
+                if subtitle:
+                    break
+
+        # Особенности (factoids) без дубликатов по значению - из них
+        # формируются price и term. Метки (labels) не входят в схему
+        # CREDIT_PRODUCT_SCHEMA, поэтому здесь не извлекаются
+        factoids = []
+        seen_values = set()
+        for factoid in card.select(".product-card__factoids .factoid"):
+            factoid_heading = factoid.select_one("h3.dk-sbol-heading")
+            if not factoid_heading:
+                continue
+            value = factoid_heading.get_text().strip()
+            if not value or value in seen_values:
+                continue
+            label = None
+            tooltip = factoid.select_one(
+                ".factoid__tooltip .dk-sbol-text p, .factoid__tooltip .dk-sbol-text span, "
+                ".factoid__tooltip .dk-sbol-text"
+            )
+            if tooltip:
+                label = tooltip.get_text().strip()
+            else:
+                factoid_desc = factoid.select_one(
+                    ".factoid__description .dk-sbol-text p, "
+                    ".factoid__description .dk-sbol-text span, "
+                    ".factoid__description .dk-sbol-text"
+                )
+                if factoid_desc:
+                    label = factoid_desc.get_text().strip()
+                    # Убираем значение из описания, если оно там есть
+                    if label and value in label:
+                        label = label.replace(value, "", 1).strip()
+            seen_values.add(value)
+            factoids.append({"value": value, "label": label or value})
+        price, term = self._classify_factoids(factoids)
+
+        # Ссылка: приоритет кнопке оформления, иначе ссылка "Подробнее"
+        link = None
+        buttons_container = card.select_one(".product-card__buttons")
+        if buttons_container:
+            buttons = buttons_container.select("a")
+            for btn in buttons:
+                btn_text = btn.get_text().strip()
+                href = btn.get("href")
+                if (btn.get("data-test-id") == "Button-primary-md" or "Оформить" in btn_text or
+                        "Подать" in btn_text or "Выбрать" in btn_text):
+                    link = href
+                    break
+                if ("Подробнее" in btn_text or "Узнать" in btn_text) and not link:
+                    link = href
+            if not link and buttons:
+                link = buttons[0].get("href")
 
         return {
-            "url": url,
             "title": title,
-            "products_count": len(products),
-            "products": products,
+            "subtitle": subtitle,
+            "price": price,
+            "term": term,
+            "link": self._normalize_link(link, url),
         }
 
-    async def _extract_products(self, driver: WebDriver, url: str) -> list[dict[str, Any]]:
+    def _parse_products_html(self, soup: BeautifulSoup | Tag, url: str) -> list[dict[str, Any]]:
         """
-        Извлечение данных о всех кредитных продуктах.
+        Извлечь все кредитные продукты из HTML страницы.
 
         Args:
-            driver: WebDriver экземпляр
-            url: URL страницы для определения типа продукта
+            soup: Разобранный HTML страницы
+            url: URL страницы
 
         Returns:
-            Список словарей с данными о продуктах
+            Список словарей с данными о продуктах (без дубликатов по названию)
         """
         products = []
-        loop = asyncio.get_event_loop()
+        seen_titles = set()
+        for wrap in soup.select(".product-card__wrap"):
+            card = wrap.select_one(".product-card")
+            if card is None:
+                continue
+            product_info = self._parse_product_element(card, url)
+            if product_info and product_info["title"] not in seen_titles:
+                seen_titles.add(product_info["title"])
+                products.append(product_info)
+        return products
 
-        # Извлекаем все продукты из основных блоков
-        try:
-            products_data = await loop.run_in_executor(
-                None,
-                driver.execute_script,
-                """
-                const products = [];
-
-                // Ищем все карточки продуктов в основном блоке
-                const cardWraps = document.querySelectorAll('.product-card__wrap');
-
-                for (const wrap of cardWraps) {
-                    try {
-                        const card = wrap.querySelector('.product-card');
-                        if (!card) continue;
-
-                        // Извлекаем название продукта
-                        let title = null;
-                        const headingInner = card.querySelector('.product-card__content_inner .product-card__heading');
-                        const headingOuter = card.querySelector('.product-card__content_outer .product-card__heading');
-                        const headingAny = card.querySelector('.product-card__heading');
-
-                        if (headingInner) {
-                            title = (headingInner.textContent || '').trim();
-                        } else if (headingOuter) {
-                            title = (headingOuter.textContent || '').trim();
-                        } else if (headingAny) {
-                            title = (headingAny.textContent || '').trim();
-                        }
+    async def parse_page(self, url: str) -> dict[str, Any]:
+        """
+        Парсинг страницы с кредитными продуктами Сбербанка.
 
-                        if (!title || title.length === 0) continue;
+        Повторные вызовы в течение cache_ttl возвращают сохраненный результат;
+        после него результат переиспользуется, если страница не изменилась.
 
-                        // Извлекаем описание (subtitle) - может быть в p или просто текст
-                        let subtitle = null;
-                        // Сначала пробуем найти в inner контейнере
-                        const descInnerContainer = card.querySelector('.product-card__content_inner .product-card__description');
-                        if (descInnerContainer) {
-                            const descInnerP = descInnerContainer.querySelector('p');
-                            subtitle = descInnerP ? (descInnerP.textContent || '').trim() : (descInnerContainer.textContent || '').trim();
-                        }
+        Args:
+            url: URL страницы для парсинга (кредиты или ипотеки)
 
-                        // Если не нашли в inner, пробуем outer
-                        if (!subtitle) {
-                            const descOuterContainer = card.querySelector('.product-card__content_outer .product-card__description');
-                            if (descOuterContainer) {
-                                const descOuterP = descOuterContainer.querySelector('p');
-                                subtitle = descOuterP ? (descOuterP.textContent || '').trim() : (descOuterContainer.textContent || '').trim();
-                            }
-                        }
+        Returns:
+            Словарь с извлеченными данными о кредитных продуктах
+        """
+        result = await self._parse_without_browser(url)
+        if result is not None:
+            return result
 
-                        // Если все еще не нашли, ищем в любом месте карточки
-                        if (!subtitle) {
-                            const descAny = card.querySelector('.product-card__description');
-                            if (descAny) {
-                                const descAnyP = descAny.querySelector('p');
-                                subtitle = descAnyP ? (descAnyP.textContent || '').trim() : (descAny.textContent || '').trim();
-                            }
-                        }
+        await self.start()
+        return await self._parse_with_driver(self.driver, url)
 
-                        // Извлекаем метки (labels) - например, "Без комиссий", "Без залогов и поручителей"
-                        const labels = [];
-                        // Ищем labels в обоих контейнерах (inner и outer) или просто в карточке
-                        const labelsContainers = card.querySelectorAll('.product-card__labels');
-                        if (labelsContainers.length === 0) {
-                            // Если labels не найдены по классу, пробуем найти в контейнерах content
-                            const contentInner = card.querySelector('.product-card__content_inner');
-                            const contentOuter = card.querySelector('.product-card__content_outer');
-                            if (contentInner) {
-                                const innerLabels = contentInner.querySelectorAll('.dk-sbol-label-nova, .product-card__label');
-                                for (const labelEl of innerLabels) {
-                                    const labelText = (labelEl.textContent || '').trim();
-                                    if (labelText) {
-                                        labels.push(labelText);
-                                    }
-                                }
-                            }
-                            if (contentOuter) {
-                                const outerLabels = contentOuter.querySelectorAll('.dk-sbol-label-nova, .product-card__label');
-                                for (const labelEl of outerLabels) {
-                                    const labelText = (labelEl.textContent || '').trim();
-                                    if (labelText && !labels.includes(labelText)) {
-                                        labels.push(labelText);
-                                    }
-                                }
-                            }
-                        } else {
-                            for (const labelsContainer of labelsContainers) {
-                                const labelElements = labelsContainer.querySelectorAll('.product-card__label, .dk-sbol-label-nova');
-                                for (const labelEl of labelElements) {
-                                    const labelText = (labelEl.textContent || '').trim();
-                                    if (labelText && !labels.includes(labelText)) {
-                                        labels.push(labelText);
-                                    }
-                                }
-                            }
-                        }
+    async def parse_pages(self, urls: list[str], max_concurrency: int = 4) -> list[dict[str, Any]]:
+        """
+        Параллельный парсинг нескольких страниц с кредитными продуктами.
 
-                        // Извлекаем особенности (factoids) - они содержат цену и срок
-                        const factoids = [];
-                        const factoidsContainers = card.querySelectorAll('.product-card__factoids');
-                        for (const factoidsContainer of factoidsContainers) {
-                            const factoidElements = factoidsContainer.querySelectorAll('.factoid');
-                            for (const factoid of factoidElements) {
-                                const factoidHeading = factoid.querySelector('h3.dk-sbol-heading');
-
-                                if (factoidHeading) {
-                                    const value = (factoidHeading.textContent || '').trim();
-                                    let label = null;
-
-                                    // Ищем описание в разных местах
-                                    const factoidTooltip = factoid.querySelector('.factoid__tooltip .dk-sbol-text p, .factoid__tooltip .dk-sbol-text span, .factoid__tooltip .dk-sbol-text');
-                                    const factoidDesc = factoid.querySelector('.factoid__description .dk-sbol-text p, .factoid__description .dk-sbol-text span, .factoid__description .dk-sbol-text');
-
-                                    if (factoidTooltip) {
-                                        label = (factoidTooltip.textContent || '').trim();
-                                    } else if (factoidDesc) {
-                                        label = (factoidDesc.textContent || '').trim();
-                                        // Убираем значение из описания, если оно там есть
-                                        if (label && label.includes(value)) {
-                                            label = label.replace(value, '').trim();
-                                        }
-                                    }
-
-                                    if (value) {
-                                        factoids.push({
-                                            value: value,
-                                            label: label || value
-                                        });
-                                    }
-                                }
-                            }
-                        }
+        Каждая страница, которой нужен браузер, получает отдельный драйвер
+        из пула; одновременно открыто не больше max_concurrency страниц.
 
-                        // Убираем дубликаты factoids по значению
-                        const uniqueFactoids = [];
-                        const seenValues = new Set();
-                        for (const factoid of factoids) {
-                            if (!seenValues.has(factoid.value)) {
-                                seenValues.add(factoid.value);
-                                uniqueFactoids.push(factoid);
-                            }
-                        }
+        Args:
+            urls: Список URL страниц для парсинга
+            max_concurrency: Максимальное число одновременно обрабатываемых страниц
 
-                        // Формируем price и term из factoids
-                        // price обычно содержит суммы (₽, млн ₽, тыс ₽)
-                        // term обычно содержит сроки (лет, дней, месяцев, мин)
-                        let priceParts = [];
-                        let termParts = [];
-
-                        for (const factoid of uniqueFactoids) {
-                            const value = factoid.value;
-                            const label = factoid.label || '';
-
-                            // Проверяем, является ли это ценой/суммой
-                            // Приоритет label, так как он более точно описывает содержимое
-                            let isPrice = false;
-                            let isTerm = false;
-
-                            // Проверка по label (более точная)
-                            if (label.includes('сумм') || label.includes('кредит') || label.includes('сумма') ||
-                                (label.includes('взнос') && value.includes('%'))) {
-                                isPrice = true;
-                            } else if (label.includes('срок') || label.includes('рассмотрим') ||
-                                      label.includes('оформление') || label.includes('обучение') ||
-                                      (label.includes('ставка') && !value.includes('₽')) ||
-                                      (label.includes('платёж') && !value.includes('₽'))) {
-                                isTerm = true;
-                            }
-                            // Если по label не определили, проверяем по value
-                            else {
-                                // Проверяем наличие цифр простым способом
-                                const hasNumbers = /[0-9]/.test(value);
-
-                                if (value.includes('₽') || value.includes('млн') || value.includes('тыс') ||
-                                    (value.includes('от') && hasNumbers) ||
-                                    (value.includes('до') && hasNumbers && (value.includes('₽') || value.includes('млн')))) {
-                                    isPrice = true;
-                                } else if (value.includes('лет') || value.includes('год') || value.includes('дней') ||
-                                          value.includes('месяц') || value.includes('мин') || value.includes('семестр') ||
-                                          (value.includes('%') && !value.includes('₽')) ||
-                                          (value.includes('сниженный') || value.includes('льготная'))) {
-                                    isTerm = true;
-                                }
-                            }
+        Returns:
+            Список результатов parse_page в порядке urls
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        # Каждой одновременно открытой странице - свой поток: долгие
+        # execute_async_script не ждут друг друга в очереди пула
+        executor = self._get_executor(max_concurrency)
+
+        async def parse_one(url: str) -> dict[str, Any]:
+            async with semaphore:
+                result = await self._parse_without_browser(url)
+                if result is not None:
+                    return result
+
+                driver = await self._pool.acquire(self._pool_key, self._create_driver, executor)
+                try:
+                    return await self._parse_with_driver(driver, url)
+                finally:
+                    await self._pool.release(self._pool_key, driver, executor)
+
+        return list(await asyncio.gather(*(parse_one(url) for url in urls)))
+
+    async def _parse_with_driver(self, driver: WebDriver, url: str) -> dict[str, Any]:
+        """
+        Парсинг страницы в указанном браузере.
 
-                            if (isPrice) {
-                                priceParts.push(value);
-                            } else if (isTerm) {
-                                termParts.push(value);
-                            } else {
-                                // Если не можем определить, пробуем по значению
-                                if (value.includes('₽') || value.includes('млн') || value.includes('тыс')) {
-                                    priceParts.push(value);
-                                } else if (value.includes('лет') || value.includes('год') || value.includes('дней') ||
-                                           value.includes('месяц') || value.includes('мин')) {
-                                    termParts.push(value);
-                                } else {
-                                    // По умолчанию добавляем в term как дополнительное условие
-                                    termParts.push(value);
-                                }
-                            }
-                        }
+        Args:
+            driver: WebDriver экземпляр
+            url: URL страницы для парсинга
 
-                        const price = priceParts.length > 0 ? priceParts.join(', ') : null;
-                        const term = termParts.length > 0 ? termParts.join(', ') : null;
-
-                        // Извлекаем ссылки
-                        let link = null;
-                        const buttonsContainer = card.querySelector('.product-card__buttons');
-                        if (buttonsContainer) {
-                            // Ищем кнопку "Оформить онлайн", "Подать заявку" или ссылку "Подробнее"/"Узнать больше"
-                            const allButtons = buttonsContainer.querySelectorAll('a');
-                            for (const btn of allButtons) {
-                                const btnText = (btn.textContent || '').trim();
-                                const testId = btn.getAttribute('data-test-id');
-                                const href = btn.getAttribute('href') || btn.href;
-
-                                // Приоритет кнопке оформления, но если её нет, берем ссылку подробнее
-                                if (testId === 'Button-primary-md' || btnText.includes('Оформить') ||
-                                    btnText.includes('Подать') || btnText.includes('Выбрать')) {
-                                    link = href;
-                                    break;
-                                } else if (btnText.includes('Подробнее') || btnText.includes('Узнать')) {
-                                    if (!link) {
-                                        link = href;
-                                    }
-                                }
-                            }
+        Returns:
+            Словарь с извлеченными данными о кредитных продуктах
+        """
+        # Переход на страницу
+        await self._run(driver.get, url)
+
+        # Ожидание карточек, прокрутка, проверка ошибки сертификатов и
+        # извлечение продуктов - одной командой. В Chrome функция извлечения
+        # уже определена на странице, в Firefox передается вместе со скриптом
+        script = (
+            _SCRAPE_PRODUCTS_JS if driver.name == "chrome"
+            else _EXTRACT_PRODUCTS_JS + _SCRAPE_PRODUCTS_JS
+        )
+        page_data: dict[str, Any] = {}
+        try:
+            page_data = await self._run(
+                driver.execute_async_script,
+                script,
+                list(self.CERT_ERROR_MARKERS),
+                int(self.timeout * 1000),
+            ) or {}
+            if "error" in page_data:
+                logger.warning("Ошибка при обработке страницы: %s", page_data["error"])
+        except Exception as e:
+            logger.warning("Ошибка при обработке страницы: %s, продолжаем парсинг...", e)
 
-                            // Если ссылка не найдена, берем первую доступную
-                            if (!link && allButtons.length > 0) {
-                                link = allButtons[0].getAttribute('href') || allButtons[0].href;
-                            }
-                        }
+        if page_data.get("ready"):
+            logger.debug("Страница загружена, элементы найдены")
+        else:
+            logger.info("Страница может быть не полностью загружена, продолжаем парсинг...")
 
-                        products.push({
-                            title: title,
-                            subtitle: subtitle,
-                            price: price || null,
-                            term: term || null,
-                            labels: labels.length > 0 ? labels : null,
-                            link: link
-                        });
-                    } catch (e) {
-                        console.error('Ошибка при извлечении продукта:', e);
-                        continue;
-                    }
-                }
+        if page_data.get("certError"):
+            logger.warning(
+                "Обнаружена страница с ошибкой сертификатов. "
+                "Убедитесь, что сертификаты Минцифры установлены в браузере."
+            )
 
-                // Также извлекаем продукты из блока "Другие предложения" (other-card), если нужно
-                // (пока пропускаем, так как структура данных может отличаться)
+        # Извлечение данных о всех продуктах (отдельный запрос к браузеру -
+        # только если скрипт не вернул продукты)
+        products = await self._extract_products(driver, url, page_data.get("products"))
 
-                return products;
-                """
-            )
+        logger.info("Извлечено продуктов: %d", len(products))
+
+        title = page_data.get("title")
+        if title is None:
+            # title - это свойство, а не метод
+            title = await self._run(lambda: driver.title)
+
+        result = {
+            "url": url,
+            "title": title,
+            "products_count": len(products),
+            "products": products,
+        }
+        # Пустой результат не сохраняем, чтобы следующий вызов повторил попытку
+        if products:
+            self._store_page(url, result, await self._fetch_validator(url))
+            return copy.deepcopy(result)
+        return result
+
+    async def _extract_products(
+        self,
+        driver: WebDriver,
+        url: str,
+        products_data: list[dict[str, Any]] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Извлечение данных о всех кредитных продуктах.
+
+        Args:
+            driver: WebDriver экземпляр
+            url: URL страницы для определения типа продукта
+            products_data: Продукты, уже извлеченные скриптом обработки
+                страницы; если None, извлечение выполняется отдельным запросом
+
+        Returns:
+            Список словарей с данными о продуктах
+        """
+        products = []
+
+        # Извлекаем все продукты из основных блоков
+        try:
+            # В Chrome функция извлечения уже определена на странице, в
+            # Firefox (или если ее нет) передаем скрипт целиком
+            if products_data is None:
+                script = (
+                    _CALL_EXTRACT_PRODUCTS_JS if driver.name == "chrome"
+                    else _INSTALL_AND_EXTRACT_PRODUCTS_JS
+                )
+                products_data = await self._run(driver.execute_script, script)
+            if products_data is None:
+                products_data = await self._run(
+                    driver.execute_script, _INSTALL_AND_EXTRACT_PRODUCTS_JS
+                )
 
             # Нормализуем ссылки
             normalized_products = []
             for product_dict in products_data:
                 if product_dict.get("title"):
+                    price, term = self._classify_factoids(product_dict.get("factoids") or [])
                     product_info = {
                         "title": product_dict.get("title"),
                         "subtitle": product_dict.get("subtitle"),
-                        "price": product_dict.get("price"),
-                        "term": product_dict.get("term"),
-                        "link": product_dict.get("link")
+                        "price": price,
+                        "term": term,
+                        # Нормализуем ссылки
+                        "link": self._normalize_link(product_dict.get("link"), url),
                     }
-                    # Labels не входят в схему CREDIT_PRODUCT_SCHEMA, поэтому не добавляем их
-                    # Нормализуем ссылки
-                    if product_info["link"] and not product_info["link"].startswith("http"):
-                        if not product_info["link"].startswith("#"):
-                            # Если ссылка относительная и не начинается с //, добавляем домен
-                            if product_info["link"].startswith("//"):
-                                product_info["link"] = f"https:{product_info['link']}"
-                            else:
-                                product_info["link"] = f"https://www.sberbank.ru{product_info['link']}"
-                        else:
-                            # Для якорных ссылок добавляем полный URL на основе исходного URL
-                            if '/credits/money' in url:
-                                product_info["link"] = f"https://www.sberbank.ru/ru/person/credits/money{product_info['link']}"
-                            elif '/credits/homenew' in url or '/credits/home' in url:
-                                product_info["link"] = f"https://www.sberbank.ru/ru/person/credits/homenew{product_info['link']}"
-                            else:
-                                # Если не можем определить, просто добавляем базовый URL
-                                product_info["link"] = f"https://www.sberbank.ru{product_info['link']}"
                     normalized_products.append(product_info)
 
             products.extend(normalized_products)
-            print(f"Найдено кредитных продуктов: {len(normalized_products)}")
+            logger.debug("Найдено кредитных продуктов: %d", len(normalized_products))
 
         except Exception as e:
-            print(f"Ошибка при извлечении продуктов: {e}")
-            traceback.print_exc()
-
-        # Если продукты не найдены, добавляем отладочную информацию
-        if len(products) == 0:
-            print("Продукты не найдены. Попытка альтернативного извлечения данных...")
-            debug_info = await loop.run_in_executor(
-                None,
+            logger.exception("Ошибка при извлечении продуктов: %s", e)
+
+        # Если продукты не найдены, добавляем отладочную информацию (отдельный
+        # запрос к браузеру - только при включенном отладочном выводе)
+        if len(products) == 0 and logger.isEnabledFor(logging.DEBUG):
+            debug_info = await self._run(
                 driver.execute_script,
                 """
                 const info = {
@@ -782,14 +1080,16 @@ class SberbankCreditProductsSeleniumParser:
                 return info;
                 """
             )
-            print(f"Отладочная информация:")
-            print(f"  Всего оберток карточек (.product-card__wrap): {debug_info.get('totalCardWraps', 0)}")
-            print(f"  Всего карточек (.product-card): {debug_info.get('totalProductCards', 0)}")
-            print(f"  Всего other-card: {debug_info.get('totalOtherCards', 0)}")
-            print(f"  Есть блок product-catalog__product-cards: {debug_info.get('hasProductCatalog', False)}")
-            print(f"  Примеры заголовков (первые 5):")
-            for i, heading in enumerate(debug_info.get('sampleHeadings', [])[:5], 1):
-                print(f"    {i}. {heading[:100]}{'...' if len(heading) > 100 else ''}")
+            logger.debug(
+                "Продукты не найдены. Оберток карточек (.product-card__wrap): %s, "
+                "карточек (.product-card): %s, other-card: %s, "
+                "есть блок product-catalog__product-cards: %s, примеры заголовков: %s",
+                debug_info.get("totalCardWraps", 0),
+                debug_info.get("totalProductCards", 0),
+                debug_info.get("totalOtherCards", 0),
+                debug_info.get("hasProductCatalog", False),
+                [heading[:100] for heading in debug_info.get("sampleHeadings", [])[:5]],
+            )
 
         # Убираем дубликаты по названию
         unique_products = []
@@ -0,0 +1,592 @@
+"""
+Общая инфраструктура Selenium-парсеров Сбербанка.
+
+Поиск установленных браузеров (с сохранением найденных путей между
+запусками), пути к драйверам, общие настройки Chrome, временные профили
+Chrome и пул запущенных браузеров. Пул один на процесс и используется
+всеми парсерами Сбербанка; при выходе из процесса все его браузеры
+завершаются.
+
+PageCacheMixin добавляет парсеру HTTP-клиент для запросов без браузера
+(с SSL-контекстом tls_context) и кэш результатов parse_page с проверкой
+изменений страницы.
+"""
+
+import asyncio
+import atexit
+import copy
+import functools
+import hashlib
+import json
+import logging
+import os
+import shutil
+import ssl
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import certifi
+import httpx
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.remote.webdriver import WebDriver
+from urllib3.exceptions import MaxRetryError
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.driver_cache import DriverCacheManager
+from webdriver_manager.firefox import GeckoDriverManager
+
+
+logger = logging.getLogger(__name__)
+
+
+# Стандартные пути установки браузеров в Windows (не меняются во время работы)
+_WIN_CHROME_PATHS = (
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+    os.path.expanduser(r"~\AppData\Local\Google\Chrome\Application\chrome.exe"),
+)
+_WIN_FIREFOX_PATHS = (
+    r"C:\Program Files\Mozilla Firefox\firefox.exe",
+    r"C:\Program Files (x86)\Mozilla Firefox\firefox.exe",
+    os.path.expanduser(r"~\AppData\Local\Mozilla Firefox\firefox.exe"),
+)
+
+
+# Результаты поиска браузеров сохраняются между запусками процесса;
+# запись старше _BROWSER_CACHE_MAX_AGE секунд считается устаревшей
+_BROWSER_CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".cache", "sber_parser", "browsers.json"
+)
+_BROWSER_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+
+# Сохраненные результаты в памяти процесса. Словарь не изменяется после
+# публикации: запись создает копию, поэтому читатели в других потоках
+# executor всегда видят целостный снимок
+_browser_cache: dict[str, str] | None = None
+_browser_cache_lock = threading.Lock()
+
+
+def _load_browser_cache() -> dict[str, str]:
+    """Прочитать файл с результатами поиска браузеров."""
+    try:
+        if time.time() - os.path.getmtime(_BROWSER_CACHE_FILE) > _BROWSER_CACHE_MAX_AGE:
+            return {}
+        with open(_BROWSER_CACHE_FILE, encoding="utf-8") as cache_file:
+            data = json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _persisted_browsers() -> dict[str, str]:
+    """
+    Получить сохраненные пути к браузерам (файл читается один раз за процесс).
+
+    Returns:
+        Словарь {'chrome': путь, 'firefox': путь} или пустой словарь, если
+        файла нет, он устарел или поврежден. Возвращаемый словарь изменять нельзя
+    """
+    global _browser_cache
+    with _browser_cache_lock:
+        if _browser_cache is None:
+            _browser_cache = _load_browser_cache()
+        return _browser_cache
+
+
+def _persist_browser(browser_name: str, path: str) -> None:
+    """Сохранить путь к найденному браузеру в файл (ошибки записи игнорируются)."""
+    global _browser_cache
+    with _browser_cache_lock:
+        if _browser_cache is None:
+            _browser_cache = _load_browser_cache()
+        if _browser_cache.get(browser_name) == path:
+            return
+        data = {**_browser_cache, browser_name: path}
+        _browser_cache = data
+        try:
+            os.makedirs(os.path.dirname(_BROWSER_CACHE_FILE), exist_ok=True)
+            with open(_BROWSER_CACHE_FILE, "w", encoding="utf-8") as cache_file:
+                json.dump(data, cache_file)
+        except OSError:
+            pass
+
+
+def _find_browser(browser_name: str) -> str | None:
+    """
+    Найти исполняемый файл браузера в PATH или в стандартных путях Windows.
+
+    Args:
+        browser_name: Имя браузера в нижнем регистре ('chrome' или 'firefox')
+
+    Returns:
+        Путь к исполняемому файлу или None, если браузер не найден
+    """
+    if browser_name == 'chrome':
+        names, win_paths = ('chrome', 'google-chrome', 'chromium'), _WIN_CHROME_PATHS
+    elif browser_name == 'firefox':
+        names, win_paths = ('firefox', 'mozilla-firefox'), _WIN_FIREFOX_PATHS
+    else:
+        return None
+
+    for name in names:
+        if path := shutil.which(name):
+            return path
+    if os.name == 'nt':
+        return next(filter(os.path.exists, win_paths), None)
+    return None
+
+
+@functools.lru_cache(maxsize=4)
+def browser_installed(browser_name: str) -> bool:
+    """
+    Проверить, установлен ли браузер (результат кэшируется на время работы процесса).
+
+    Путь к найденному браузеру запоминается в файле, поэтому новый процесс
+    проверяет только его наличие, а не PATH и все стандартные пути установки.
+    Отрицательный результат не сохраняется: установленный позже браузер
+    будет найден, а удаленный - не будет считаться установленным.
+
+    Args:
+        browser_name: Имя браузера в нижнем регистре ('chrome' или 'firefox')
+
+    Returns:
+        True, если браузер установлен, False в противном случае
+    """
+    cached_path = _persisted_browsers().get(browser_name)
+    if isinstance(cached_path, str) and os.path.exists(cached_path):
+        return True
+
+    path = _find_browser(browser_name)
+    if path is None:
+        return False
+    _persist_browser(browser_name, path)
+    return True
+
+
+# Сколько дней скачанный драйвер считается актуальным без проверки новой версии
+_DRIVER_CACHE_VALID_DAYS = 7
+
+
+@functools.lru_cache(maxsize=1)
+def chrome_driver_path() -> str:
+    """
+    Получить путь к chromedriver (сетевая проверка версии - один раз за процесс).
+
+    Путь можно закрепить переменной окружения SBER_CHROMEDRIVER - тогда
+    webdriver-manager не вызывается вовсе.
+
+    Returns:
+        Путь к исполняемому файлу chromedriver
+    """
+    return os.getenv("SBER_CHROMEDRIVER") or ChromeDriverManager(
+        cache_manager=DriverCacheManager(valid_range=_DRIVER_CACHE_VALID_DAYS)
+    ).install()
+
+
+@functools.lru_cache(maxsize=1)
+def gecko_driver_path() -> str:
+    """
+    Получить путь к geckodriver (сетевая проверка версии - один раз за процесс).
+
+    Путь можно закрепить переменной окружения SBER_GECKODRIVER.
+
+    Returns:
+        Путь к исполняемому файлу geckodriver
+    """
+    return os.getenv("SBER_GECKODRIVER") or GeckoDriverManager(
+        cache_manager=DriverCacheManager(valid_range=_DRIVER_CACHE_VALID_DAYS)
+    ).install()
+
+
+# Отключение фоновых служб Chrome, не нужных парсерам (ускоряет запуск)
+CHROME_PERFORMANCE_ARGUMENTS = (
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-features=Translate,MediaRouter,OptimizationHints",
+)
+
+
+def build_chrome_options(
+    headless: bool, viewport_width: int, viewport_height: int, user_agent: str
+) -> ChromeOptions:
+    """
+    Создать настройки Chrome, общие для парсеров Сбербанка.
+
+    Профиль, блокировку ресурсов и прочие особенности парсер добавляет сам.
+
+    Args:
+        headless: Запускать браузер без окна
+        viewport_width: Ширина окна браузера
+        viewport_height: Высота окна браузера
+        user_agent: Строка User-Agent
+
+    Returns:
+        Настройки для webdriver.Chrome
+    """
+    options = ChromeOptions()
+    # driver.get возвращается на DOMContentLoaded: готовность карточек
+    # парсеры проверяют сами
+    options.page_load_strategy = 'eager'
+
+    if headless:
+        options.add_argument("--headless=new")
+
+    options.add_argument(f"--window-size={viewport_width},{viewport_height}")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument("--disable-dev-shm-usage")
+    if os.name != 'nt':
+        # Без песочницы Chrome не запускается от root в Linux-контейнерах;
+        # в Windows флаг лишь ослабляет защиту
+        options.add_argument("--no-sandbox")
+    options.add_argument("--lang=ru-RU")
+    for argument in CHROME_PERFORMANCE_ARGUMENTS:
+        options.add_argument(argument)
+
+    options.add_argument(f"user-agent={user_agent}")
+
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+    # Изображения не загружаются и не декодируются; запросы уведомлений отклоняются
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    })
+    options.add_argument("--allow-running-insecure-content")
+    options.add_argument("--ignore-certificate-errors")
+    return options
+
+
+class ChromeProfileDirs:
+    """
+    Временные профили Chrome, общие для процесса.
+
+    Профиль (дисковый кэш HTTP, HSTS, TLS-сессии) переживает перезапуск
+    браузера, поэтому новый драйвер не загружает кэшируемые ресурсы заново.
+    Один профиль может использовать только один запущенный Chrome, поэтому
+    каталоги выдаются по одному на браузер и возвращаются после его закрытия.
+    """
+
+    def __init__(self) -> None:
+        self._root: str | None = None
+        self._free: list[str] = []
+        self._by_session: dict[str, str] = {}
+        self._created = 0
+        # Драйверы создаются в потоках executor
+        self._lock = threading.Lock()
+
+    def acquire(self) -> str:
+        """Взять свободный каталог профиля или создать новый."""
+        with self._lock:
+            if self._free:
+                return self._free.pop()
+            if self._root is None:
+                self._root = tempfile.mkdtemp(prefix="sber-chrome-")
+            self._created += 1
+            return os.path.join(self._root, f"profile-{self._created}")
+
+    def bind(self, session_id: str, profile_dir: str) -> None:
+        """Запомнить, какой профиль занят сессией драйвера."""
+        with self._lock:
+            self._by_session[session_id] = profile_dir
+
+    def release(self, profile_dir: str) -> None:
+        """Вернуть каталог профиля для следующего браузера."""
+        with self._lock:
+            self._free.append(profile_dir)
+
+    def release_session(self, session_id: str | None) -> None:
+        """Освободить профиль завершенной сессии драйвера (если он был выдан)."""
+        with self._lock:
+            profile_dir = self._by_session.pop(session_id, None) if session_id else None
+            if profile_dir is not None:
+                self._free.append(profile_dir)
+
+    def cleanup(self) -> None:
+        """Удалить все временные профили."""
+        if self._root is not None:
+            shutil.rmtree(self._root, ignore_errors=True)
+        self._root = None
+        self._free.clear()
+        self._by_session.clear()
+
+
+chrome_profiles = ChromeProfileDirs()
+
+# Ошибки обращения к драйверу, сессия которого потеряна: WebDriverException
+# от браузера, MaxRetryError/ConnectionError - если процесс драйвера
+# (chromedriver, geckodriver) уже завершился и не принимает соединения
+_DEAD_SESSION_ERRORS = (WebDriverException, MaxRetryError, ConnectionError)
+
+# Ключ пула: (имя класса парсера, headless, ширина, высота). Имя класса
+# разделяет браузеры парсеров - они по-разному настраивают драйвер
+DriverPoolKey = tuple[str, bool, int, int]
+
+
+class DriverPool:
+    """
+    Пул запущенных браузеров, общий для всех экземпляров парсеров.
+
+    Запуск браузера занимает несколько секунд, поэтому после закрытия парсера
+    драйвер не завершается, а очищается и возвращается в пул. Драйверы
+    группируются по ключу (парсер, headless, ширина, высота), чтобы парсер
+    всегда получал браузер с нужными настройками.
+    """
+
+    # Сколько свободных браузеров хранить на один ключ. Остальные
+    # завершаются при возврате: окна браузеров с headless=False иначе
+    # оставались бы открытыми до выхода из процесса
+    MAX_IDLE_PER_KEY = 2
+
+    def __init__(self) -> None:
+        self._idle: dict[DriverPoolKey, list[WebDriver]] = {}
+
+    @staticmethod
+    def _is_alive(driver: WebDriver) -> bool:
+        """Проверить, что сессия драйвера еще жива."""
+        try:
+            driver.title
+            return True
+        except _DEAD_SESSION_ERRORS:
+            return False
+
+    @staticmethod
+    def _quit_quietly(driver: WebDriver) -> None:
+        """Завершить драйвер, игнорируя ошибки уже потерянной сессии."""
+        try:
+            driver.quit()
+        except _DEAD_SESSION_ERRORS:
+            pass
+        chrome_profiles.release_session(driver.session_id)
+
+    @classmethod
+    def _reset(cls, driver: WebDriver) -> bool:
+        """
+        Очистить состояние браузера перед повторным использованием.
+
+        Returns:
+            True, если драйвер можно вернуть в пул
+        """
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            return True
+        except _DEAD_SESSION_ERRORS:
+            cls._quit_quietly(driver)
+            return False
+
+    async def acquire(
+        self,
+        key: DriverPoolKey,
+        factory: Callable[[], WebDriver],
+        executor: ThreadPoolExecutor | None = None,
+    ) -> WebDriver:
+        """
+        Взять свободный драйвер из пула или создать новый.
+
+        Args:
+            key: Ключ настроек браузера (парсер, headless, ширина, высота)
+            factory: Функция создания нового драйвера
+            executor: Пул потоков для блокирующих вызовов Selenium
+
+        Returns:
+            Рабочий экземпляр WebDriver
+        """
+        loop = asyncio.get_running_loop()
+        idle = self._idle.get(key, [])
+        while idle:
+            driver = idle.pop()
+            if await loop.run_in_executor(executor, self._is_alive, driver):
+                return driver
+            # Сессия потеряна (браузер закрыт или упал) - создаем новый драйвер
+            await loop.run_in_executor(executor, self._quit_quietly, driver)
+        return await loop.run_in_executor(executor, factory)
+
+    async def release(
+        self,
+        key: DriverPoolKey,
+        driver: WebDriver,
+        executor: ThreadPoolExecutor | None = None,
+    ) -> None:
+        """
+        Вернуть драйвер в пул после очистки cookies и текущей страницы.
+
+        Если свободных драйверов с таким ключом уже MAX_IDLE_PER_KEY,
+        драйвер завершается.
+
+        Args:
+            key: Ключ настроек браузера (парсер, headless, ширина, высота)
+            driver: Освобождаемый драйвер
+            executor: Пул потоков для блокирующих вызовов Selenium
+        """
+        loop = asyncio.get_running_loop()
+        idle = self._idle.setdefault(key, [])
+        if len(idle) >= self.MAX_IDLE_PER_KEY:
+            await loop.run_in_executor(executor, self._quit_quietly, driver)
+        elif await loop.run_in_executor(executor, self._reset, driver):
+            idle.append(driver)
+
+    def shutdown(self) -> None:
+        """Завершить все свободные драйверы пула и удалить временные профили."""
+        for drivers in self._idle.values():
+            for driver in drivers:
+                self._quit_quietly(driver)
+        self._idle.clear()
+        chrome_profiles.cleanup()
+
+
+driver_pool = DriverPool()
+atexit.register(driver_pool.shutdown)
+
+
+@functools.lru_cache(maxsize=1)
+def tls_context() -> ssl.SSLContext:
+    """
+    Получить SSL-контекст для запросов без браузера (создается один раз за процесс).
+
+    Доверенные корневые сертификаты: certifi, системное хранилище (в Windows
+    туда устанавливаются сертификаты Минцифры) и, если задан, PEM-файл из
+    переменной окружения SBER_CA_BUNDLE (например, Russian Trusted Root CA
+    с https://www.gosuslugi.ru/crt).
+
+    Returns:
+        SSL-контекст с проверкой сертификатов
+    """
+    context = ssl.create_default_context(cafile=certifi.where())
+    context.load_default_certs()
+    ca_bundle = os.getenv("SBER_CA_BUNDLE")
+    if ca_bundle:
+        try:
+            context.load_verify_locations(cafile=ca_bundle)
+        except (OSError, ssl.SSLError) as e:
+            logger.warning("Не удалось загрузить сертификаты из SBER_CA_BUNDLE: %s", e)
+    return context
+
+
+# Признак версии, вычисленный по содержимому страницы: HEAD-запросом его
+# не проверить, нужна полная загрузка
+_CONTENT_VALIDATOR_PREFIX = "blake2b:"
+
+
+class PageCacheMixin:
+    """
+    HTTP-клиент для запросов без браузера и кэш результатов parse_page.
+
+    Результаты общие для экземпляров одного класса парсера: url ->
+    (время сохранения, признак версии страницы, результат). В течение
+    cache_ttl результат возвращается сразу, после этого - если страница
+    не изменилась (ETag/Last-Modified или хэш содержимого).
+
+    Класс парсера задает CHROME_USER_AGENT, экземпляр - атрибут timeout.
+    """
+
+    # Время жизни сохраненного результата (секунды) и размер кэша
+    CACHE_TTL = 300.0
+    CACHE_MAX_ENTRIES = 16
+
+    CHROME_USER_AGENT: str
+    timeout: float
+    # Экземпляр может переопределить время жизни результата
+    cache_ttl: float = CACHE_TTL
+    _page_cache: dict[str, tuple[float, str | None, dict[str, Any]]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._page_cache = {}
+
+    def _http_client(self) -> httpx.AsyncClient:
+        """Создать HTTP-клиент с заголовками браузера для запросов без Selenium."""
+        headers = {
+            "User-Agent": self.CHROME_USER_AGENT,
+            "Accept-Language": "ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7",
+        }
+        # Если сертификат не проходит проверку, запрос завершается ошибкой
+        # и страница разбирается в браузере
+        return httpx.AsyncClient(
+            headers=headers,
+            timeout=self.timeout,
+            follow_redirects=True,
+            verify=tls_context(),
+        )
+
+    @staticmethod
+    def _header_validator(headers: httpx.Headers) -> str | None:
+        """Получить признак версии страницы из ETag или Last-Modified."""
+        if etag := headers.get("etag"):
+            return f"etag:{etag}"
+        if last_modified := headers.get("last-modified"):
+            return f"modified:{last_modified}"
+        return None
+
+    @staticmethod
+    def _content_validator(content: bytes) -> str:
+        """Получить признак версии страницы по хэшу ее содержимого."""
+        return _CONTENT_VALIDATOR_PREFIX + hashlib.blake2b(content, digest_size=16).hexdigest()
+
+    async def _fetch_validator(self, url: str) -> str | None:
+        """
+        Узнать признак версии страницы легким HEAD-запросом.
+
+        Args:
+            url: URL страницы
+
+        Returns:
+            Признак версии (ETag/Last-Modified) или None, если сервер их не отдает
+        """
+        try:
+            async with self._http_client() as client:
+                response = await client.head(url)
+                response.raise_for_status()
+        except httpx.HTTPError:
+            return None
+        return self._header_validator(response.headers)
+
+    async def _get_unchanged_page(self, url: str) -> tuple[dict[str, Any] | None, str | None]:
+        """
+        Найти сохраненный результат, если страница заведомо не изменилась.
+
+        Args:
+            url: URL страницы
+
+        Returns:
+            Кортеж (копия результата или None, признак версии сохраненной
+            записи). Результат равен None, если записи нет или после cache_ttl
+            изменения нельзя исключить без загрузки страницы
+        """
+        entry = self._page_cache.get(url)
+        if entry is None:
+            return None, None
+        stored_at, validator, result = entry
+        if time.monotonic() - stored_at >= self.cache_ttl:
+            # Сервер отдает ETag/Last-Modified - проверяем изменения HEAD-запросом
+            if validator is None or validator.startswith(_CONTENT_VALIDATOR_PREFIX):
+                return None, validator
+            if await self._fetch_validator(url) != validator:
+                return None, validator
+            self._store_page(url, result, validator)
+        logger.debug("Страница не изменилась, используется сохраненный результат")
+        return copy.deepcopy(result), validator
+
+    def _renew_page(self, url: str) -> dict[str, Any] | None:
+        """Продлить срок жизни сохраненного результата и вернуть его копию."""
+        entry = self._page_cache.get(url)
+        if entry is None:
+            return None
+        _, validator, result = entry
+        self._store_page(url, result, validator)
+        logger.debug("Страница не изменилась, используется сохраненный результат")
+        return copy.deepcopy(result)
+
+    def _store_page(self, url: str, result: dict[str, Any], validator: str | None) -> None:
+        """Сохранить результат парсинга (самые старые записи вытесняются)."""
+        cache = self._page_cache
+        cache.pop(url, None)
+        cache[url] = (time.monotonic(), validator, result)
+        while len(cache) > self.CACHE_MAX_ENTRIES:
+            del cache[next(iter(cache))]
@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 from typing import Any, Optional
 
 import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtWidgets import (
     QComboBox,
@@ -225,7 +226,14 @@ async def _parse_moex_data(parser_params: dict[str, Any]) -> dict[str, Any]:
         all_candles_dfs = []
         processed_securities = []
 
-        for _, row in securities_df.head(max_securities).iterrows():
+        # Берем только нужные поля: iterrows упаковывал бы в объекты Python
+        # все столбцы широкой таблицы MOEX
+        wanted = ("secid", "SECID", "shortname", "name", "primary_boardid", "board")
+        fields = [col for col in wanted if col in securities_df.columns]
+        for values in (
+            securities_df.head(max_securities)[fields].itertuples(index=False, name=None)
+        ):
+            row = dict(zip(fields, values))
             secid = row.get("secid", row.get("SECID", ""))
             shortname = row.get("shortname", row.get("name", ""))
             board = row.get("primary_boardid", row.get("board", "TQBR"))
@@ -257,7 +265,12 @@ async def _parse_moex_data(parser_params: dict[str, Any]) -> dict[str, Any]:
         if all_candles_dfs:
             combined_df = pd.concat(all_candles_dfs, ignore_index=True)
             if "begin" in combined_df.columns:
-                combined_df["begin"] = pd.to_datetime(combined_df["begin"])
+                # Обычно даты уже разобраны в _format_candles_dataframe -
+                # повторное преобразование лишь копировало бы столбец
+                if not is_datetime64_any_dtype(combined_df["begin"]):
+                    combined_df["begin"] = pd.to_datetime(
+                        combined_df["begin"], errors="coerce", cache=True
+                    )
                 combined_df = combined_df.sort_values("begin").reset_index(drop=True)
         else:
             combined_df = pd.DataFrame()